@@ -35,4 +35,8 @@ setup(
         "nibabel",
         "pika",
     ],
+    extras_require={
+        # picked up automatically by uvicorn for the REST server and the file storage
+        "speedups": ["uvloop; sys_platform != 'win32'", "httptools"],
+    },
 )
@@ -0,0 +1,108 @@
+import threading
+
+from pathlib import Path
+import sys, os
+
+sys.path.insert(0, Path(os.path.dirname(__file__)).parent.parent.as_posix())
+
+from theoden.common import BackgroundWorker
+
+
+def test_items_are_processed_in_order():
+    # Arrange
+    processed = []
+    worker = BackgroundWorker(processed.append)
+
+    # Act
+    for i in range(100):
+        worker.submit(i)
+
+    # Assert
+    assert worker.flush(timeout=5)
+    assert processed == list(range(100))
+
+
+def test_pending_item_is_replaced_by_item_with_same_key():
+    # Arrange
+    processed = []
+    blocked = threading.Event()
+    worker = BackgroundWorker(
+        lambda item: blocked.wait(5) if item == "block" else processed.append(item)
+    )
+    worker.submit("block")
+
+    # Act
+    worker.submit("old", key="a")
+    worker.submit("other")
+    worker.submit("new", key="a")
+    blocked.set()
+
+    # Assert
+    assert worker.flush(timeout=5)
+    assert processed == ["new", "other"]
+
+
+def test_superseded_item_is_skipped():
+    # Arrange
+    processed = []
+    blocked = threading.Event()
+    worker = BackgroundWorker(
+        lambda item: blocked.wait(5) if item == "block" else processed.append(item),
+        supersedes=lambda item, next_item: item == next_item,
+    )
+    worker.submit("block")
+
+    # Act
+    for item in ["a", "a", "b", "a"]:
+        worker.submit(item)
+    blocked.set()
+
+    # Assert
+    assert worker.flush(timeout=5)
+    assert processed == ["a", "b", "a"]
+
+
+def test_exception_does_not_stop_the_worker():
+    # Arrange
+    processed = []
+
+    def process(item):
+        if item == 0:
+            raise ValueError("failed")
+        processed.append(item)
+
+    worker = BackgroundWorker(process)
+
+    # Act
+    worker.submit(0)
+    worker.submit(1)
+
+    # Assert
+    assert worker.flush(timeout=5)
+    assert processed == [1]
+
+
+def test_concurrent_first_submits_start_one_thread_and_keep_all_items():
+    # Arrange
+    processed = []
+    worker = BackgroundWorker(processed.append)
+    threads_before = threading.active_count()
+    start = threading.Barrier(8)
+
+    def submit(offset):
+        start.wait()
+        for i in range(100):
+            worker.submit(offset + i)
+
+    submitters = [threading.Thread(target=submit, args=(n * 100,)) for n in range(8)]
+
+    # Act
+    for submitter in submitters:
+        submitter.start()
+    for submitter in submitters:
+        submitter.join()
+
+    # Assert
+    assert worker.flush(timeout=5)
+    assert sorted(processed) == list(range(800))
+    assert threading.active_count() == threads_before + 1
@@ -0,0 +1,67 @@
+import multiprocessing
+from pathlib import Path
+import sys, os
+
+sys.path.insert(0, Path(os.path.dirname(__file__)).parent.parent.as_posix())
+
+from theoden.common import GlobalContext
+
+
+def test_changes_to_nested_sections_do_not_leak_into_the_next_load(tmp_path):
+    # Arrange
+    path = tmp_path / "global_context.yaml"
+    path.write_text("datasets:\n  mnist: /data/mnist\n")
+    context = GlobalContext()
+    context.load_from_yaml(path.as_posix())
+
+    # Act
+    context["datasets"]["mnist"] = "/changed"
+    context.load_from_yaml(path.as_posix())
+
+    # Assert
+    assert context["datasets"]["mnist"] == "/data/mnist"
+
+
+def _set_in_child(context, key, value):
+    context.set(key, value)
+
+
+def _run_in_forked_child(context, key, value):
+    child = multiprocessing.get_context("fork").Process(
+        target=_set_in_child, args=(context, key, value)
+    )
+    child.start()
+    child.join()
+
+
+def test_loaded_context_is_copied_into_forked_children(tmp_path):
+    # Arrange
+    path = tmp_path / "global_context.yaml"
+    path.write_text("partition_folder: /partitions\n")
+    context = object.__new__(GlobalContext)
+    context.__init__()
+    context.load_from_yaml(path.as_posix())
+
+    # Act
+    _run_in_forked_child(context, "partition_folder", "/child")
+
+    # Assert
+    assert context["partition_folder"] == "/partitions"
+
+
+def test_set_context_is_shared_with_forked_children(tmp_path):
+    # Arrange
+    path = tmp_path / "global_context.yaml"
+    path.write_text("partition_folder: /partitions\n")
+    context = object.__new__(GlobalContext)
+    context.__init__()
+    context.set("model_save_folder", "/models")
+    context.load_from_yaml(path.as_posix())
+
+    # Act
+    _run_in_forked_child(context, "partition_folder", "/child")
+
+    # Assert
+    assert context["partition_folder"] == "/child"
+    assert context.get("model_save_folder", None) is None
+    context._manager.shutdown()
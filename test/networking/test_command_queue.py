@@ -0,0 +1,48 @@
+import asyncio
+import pytest
+from pathlib import Path
+from queue import Empty
+import sys, os
+
+sys.path.insert(0, Path(os.path.dirname(__file__)).parent.parent.as_posix())
+
+from theoden.networking.command_queue import CommandQueue, SharedMemoryCommandQueue
+
+
+@pytest.fixture
+def command_queue():
+    queue = SharedMemoryCommandQueue(size=128)
+    yield queue
+    queue.close(unlink=True)
+
+
+def test_commands_are_returned_in_order_across_wrap_around(command_queue):
+    # Act
+    received = []
+    for i in range(50):
+        command_queue.put({"datatype": "Command", "data": {"i": i}})
+        received.append(command_queue.get(timeout=1))
+
+    # Assert
+    assert [command["data"]["i"] for command in received] == list(range(50))
+
+
+def test_get_on_empty_queue_raises(command_queue):
+    with pytest.raises(Empty):
+        command_queue.get_nowait()
+
+
+def test_put_of_oversized_command_raises(command_queue):
+    with pytest.raises(ValueError):
+        command_queue.put({"data": "x" * 256})
+
+
+def test_wake_after_the_loop_is_closed_does_nothing():
+    # Arrange
+    queue = CommandQueue()
+    loop = asyncio.new_event_loop()
+    queue.attach(loop)
+    loop.close()
+
+    # Act & Assert
+    queue.wake()
@@ -0,0 +1,77 @@
+import json
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+import sys, os
+import threading
+
+sys.path.insert(0, Path(os.path.dirname(__file__)).parent.parent.as_posix())
+
+from theoden.common import BackgroundWorker, ServerRequestError, StatusUpdate
+from theoden.networking.rabbitmq import ClientToMQInterface
+
+
+def _interface(failing: set[str]) -> ClientToMQInterface:
+    # an interface without a connection, publishing fails for the given commands
+    interface = ClientToMQInterface.__new__(ClientToMQInterface)
+    interface.status_update_retries = 1
+    interface.status_update_retry_delay = 0.0
+    interface.execute_channel = SimpleNamespace(is_closed=False)
+    interface._command_received = threading.Event()
+    interface._last_pull = None
+
+    def publish(status_update, files):
+        if status_update.command_uuid in failing:
+            raise ConnectionError("connection lost")
+
+    interface._publish_status_update = publish
+    interface._status_update_publisher = BackgroundWorker(
+        lambda item: interface._publish_status_update_with_retries(*item)
+    )
+    return interface
+
+
+def test_failed_status_update_is_reported_by_its_own_future():
+    # Arrange
+    interface = _interface(failing={"failing"})
+
+    # Act
+    failed = interface.send_status_update(
+        StatusUpdate(command_uuid="failing", status=2, datatype="")
+    )
+    sent = interface.send_status_update(
+        StatusUpdate(command_uuid="working", status=2, datatype="")
+    )
+
+    # Assert
+    with pytest.raises(ServerRequestError):
+        failed.result(timeout=5)
+    assert sent.result(timeout=5) is None
+
+
+def test_request_loop_does_not_pull_while_a_pull_is_outstanding():
+    # Arrange
+    interface = _interface(failing=set())
+    interface.ping_interval = 60
+    commands = []
+    interface.command_queue = SimpleNamespace(put=commands.append)
+    pulls = []
+    interface.send_server_request = pulls.append
+    response = json.dumps(
+        {
+            "message_type": "ServerRequestResponse",
+            "data": {"response": {"data": {"command": "command"}}},
+        }
+    )
+
+    # Act
+    first = interface._pull()
+    interface._on_response(None, None, None, response)
+    second = interface._pull()
+    third = interface._pull()
+
+    # Assert
+    assert (first, second, third) == (False, True, False)
+    # the first pull of the request loop and the one of `_on_response`
+    assert len(pulls) == 2
+    assert commands == [{"command": "command"}]
@@ -0,0 +1,22 @@
+import subprocess
+import sys
+from pathlib import Path
+import os
+
+
+def test_start_storage_does_not_import_the_ml_stack():
+    # Arrange
+    root = Path(os.path.dirname(__file__)).parent.parent.as_posix()
+    code = (
+        "import sys; from theoden import start_storage; "
+        "print([m for m in ('torch', 'pandas') if m in sys.modules])"
+    )
+
+    # Act
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+    )
+
+    # Assert
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,45 @@
+import threading
+from collections import deque
+from types import SimpleNamespace
+
+from pathlib import Path
+import sys, os
+
+sys.path.insert(0, Path(os.path.dirname(__file__)).parent.parent.as_posix())
+
+from theoden.operations import Action, PullCommandRequest
+from theoden.operations.instructions import InstructionStatus
+from theoden.resources import ResourceManager
+
+
+class RecordingAction(Action, base_type=Action):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.performed_in = []
+
+    def perform(self, topology, resource_manager):
+        self.performed_in.append(threading.get_ident())
+        # a request that is handled while the action runs would see this change
+        resource_manager["changed_by_action"] = True
+        return None
+
+
+def test_action_is_completed_before_the_pull_returns():
+    # Arrange
+    action = RecordingAction()
+    server = SimpleNamespace(
+        operations=deque([action]),
+        history=[],
+        topology=None,
+        resources=ResourceManager(),
+    )
+    request = PullCommandRequest()
+    request.server = server
+
+    # Act
+    request.execute()
+
+    # Assert
+    assert action.performed_in == [threading.get_ident()]
+    assert action.status is InstructionStatus.COMPLETED
+    assert server.resources["changed_by_action"] is True
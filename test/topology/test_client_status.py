@@ -0,0 +1,74 @@
+import time
+
+import pytest
+from pathlib import Path
+import sys, os
+
+sys.path.insert(0, Path(os.path.dirname(__file__)).parent.parent.as_posix())
+
+from theoden.resources import ResourceManager
+from theoden.topology.client_status import TimeoutClientStatusObserver
+from theoden.topology.topology import Node, NodeStatus, NodeType, Topology
+
+
+class RecordingWatcherPool:
+    def notify_all(self, notification, origin=None, parallel=False, background=False):
+        return self
+
+
+def wait_for_status(node, status, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while node.status is not status and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return node.status
+
+
+@pytest.fixture
+def topology():
+    return Topology(
+        watcher_pool=RecordingWatcherPool(),
+        resource_manager=ResourceManager(),
+        observer=TimeoutClientStatusObserver(timeout=0.05),
+    )
+
+
+def test_client_set_online_times_out(topology):
+    # Arrange
+    node = Node(node_name="client_1", node_type=NodeType.CLIENT)
+    topology.add_node(node)
+
+    # Act
+    topology.set_online("client_1")
+
+    # Assert
+    assert wait_for_status(node, NodeStatus.OFFLINE) is NodeStatus.OFFLINE
+
+
+def test_client_added_online_times_out(topology):
+    # Arrange
+    node = Node(
+        node_name="client_1", node_type=NodeType.CLIENT, status=NodeStatus.ONLINE
+    )
+
+    # Act
+    topology.add_node(node)
+
+    # Assert
+    assert wait_for_status(node, NodeStatus.OFFLINE) is NodeStatus.OFFLINE
+
+
+def test_active_client_stays_online(topology):
+    # Arrange
+    node = Node(node_name="client_1", node_type=NodeType.CLIENT)
+    topology.add_node(node)
+    topology.set_online("client_1")
+
+    # Act
+    deadline = time.monotonic() + 0.2
+    while time.monotonic() < deadline:
+        node.last_active = time.monotonic()
+        time.sleep(0.01)
+
+    # Assert
+    assert node.status is NodeStatus.ONLINE
+    assert wait_for_status(node, NodeStatus.OFFLINE) is NodeStatus.OFFLINE
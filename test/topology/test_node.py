@@ -0,0 +1,30 @@
+from pathlib import Path
+from types import SimpleNamespace
+import sys, os
+
+sys.path.insert(0, Path(os.path.dirname(__file__)).parent.parent.as_posix())
+
+from theoden.topology.node import Node
+
+
+def test_failing_command_does_not_drop_the_rest_of_the_batch():
+    # Arrange
+    executed = []
+
+    def execute_command(command_json):
+        if command_json["fails"]:
+            raise ValueError("command failed")
+        executed.append(command_json["name"])
+
+    node = SimpleNamespace(_execute_command=execute_command)
+    batch = [
+        {"name": "first", "fails": False},
+        {"name": "second", "fails": True},
+        {"name": "third", "fails": False},
+    ]
+
+    # Act
+    Node._execute_commands(node, batch)
+
+    # Assert
+    assert executed == ["first", "third"]
@@ -0,0 +1,84 @@
+import pytest
+from pathlib import Path
+import sys, os
+
+sys.path.insert(0, Path(os.path.dirname(__file__)).parent.parent.as_posix())
+
+from theoden.resources import ResourceManager
+from theoden.topology.topology import Node, NodeStatus, NodeType, Topology
+
+
+class RecordingWatcherPool:
+    def __init__(self):
+        self.notifications = []
+
+    def notify_all(self, notification, origin=None, parallel=False, background=False):
+        self.notifications.append(notification)
+        return self
+
+
+@pytest.fixture
+def watcher_pool():
+    return RecordingWatcherPool()
+
+
+@pytest.fixture
+def topology(watcher_pool):
+    topology = Topology(watcher_pool=watcher_pool, resource_manager=ResourceManager())
+    for name in ["client_1", "client_2", "client_3"]:
+        topology.add_node(
+            Node(node_name=name, node_type=NodeType.CLIENT, status=NodeStatus.ONLINE)
+        )
+    watcher_pool.notifications.clear()
+    return topology
+
+
+def test_remove_flag_of_nodes_removes_the_flag(topology):
+    # Arrange
+    topology.set_flag_of_nodes(["client_1", "client_2"], "selected")
+
+    # Act
+    topology.remove_flag_of_nodes(["client_1", "client_2"], "selected")
+
+    # Assert
+    assert topology.get_flags_of_client("client_1") == []
+    assert topology.get_flags_of_client("client_2") == []
+    assert topology.get_clients_with_flag("selected") == []
+    assert len(topology.get_clients_without_flag("selected")) == 3
+
+
+def test_remove_flag_of_nodes_notifies_once_per_batch(topology, watcher_pool):
+    # Arrange
+    topology.set_flag_of_nodes(["client_1", "client_2", "client_3"], "selected")
+    watcher_pool.notifications.clear()
+
+    # Act
+    topology.remove_flag_of_nodes(["client_1", "client_2", "client_3"], "selected")
+
+    # Assert
+    assert len(watcher_pool.notifications) == 1
+
+
+def test_remove_missing_flag_does_not_notify(topology, watcher_pool):
+    # Act
+    topology.remove_flag_of_nodes(["client_1", "client_2"], "selected")
+
+    # Assert
+    assert watcher_pool.notifications == []
+
+
+def test_topology_change_notification_is_not_affected_by_later_changes(
+    topology, watcher_pool
+):
+    # Arrange
+    topology.set_flag_of_nodes(["client_1"], "selected")
+    notified = watcher_pool.notifications[-1].topology
+
+    # Act
+    topology.set_offline("client_1")
+    topology.remove_flag_of_nodes(["client_1"], "selected")
+
+    # Assert
+    assert notified is not topology
+    assert notified.get_flags_of_client("client_1") == ["selected"]
+    assert notified.num_connected_clients == 3
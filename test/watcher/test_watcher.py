@@ -0,0 +1,142 @@
+import pytest
+from pathlib import Path
+import sys, os
+
+sys.path.insert(0, Path(os.path.dirname(__file__)).parent.parent.as_posix())
+
+from theoden.watcher import (
+    InitializationNotification,
+    Watcher,
+    WatcherNotification,
+    WatcherPool,
+)
+
+
+def recorder(received, name):
+    return lambda notification, origin=None: received.append(name)
+
+
+def test_pool_notices_changed_interests_of_added_watcher():
+    # Arrange
+    received = []
+    watcher = Watcher()
+    pool = WatcherPool(base_topology=None).add(watcher)
+    pool.notify_all(InitializationNotification())
+
+    # Act
+    watcher.notification_of_interest = {
+        InitializationNotification: recorder(received, "initialization")
+    }
+    pool.notify_all(InitializationNotification())
+
+    # Assert
+    assert received == ["initialization"]
+
+
+class BaseNotification(WatcherNotification):
+    __slots__ = ()
+
+
+class DerivedNotification(BaseNotification):
+    __slots__ = ()
+
+
+def test_handler_of_closest_class_is_called():
+    # Arrange
+    received = []
+    watcher = Watcher(
+        {
+            BaseNotification: recorder(received, "base"),
+            DerivedNotification: recorder(received, "derived"),
+        },
+        fallback_handler=recorder(received, "fallback"),
+    )
+
+    # Act
+    watcher.listen(DerivedNotification())
+    watcher.listen(BaseNotification())
+
+    # Assert
+    assert received == ["derived", "base"]
+
+
+def test_subclass_is_handled_by_handler_of_base_class():
+    # Arrange
+    received = []
+    watcher = Watcher({BaseNotification: recorder(received, "base")})
+
+    # Act
+    watcher.listen(DerivedNotification())
+
+    # Assert
+    assert received == ["base"]
+
+
+def test_fallback_handler_is_only_called_without_matching_handler():
+    # Arrange
+    received = []
+    watcher = Watcher(
+        {
+            BaseNotification: recorder(received, "base"),
+            InitializationNotification: recorder(received, "initialization"),
+        },
+        fallback_handler=recorder(received, "fallback"),
+    )
+
+    # Act
+    watcher.listen(BaseNotification())
+    watcher.listen(WatcherNotification())
+
+    # Assert
+    assert received == ["base", "fallback"]
+
+
+def test_assigning_handlers_resets_the_cached_handlers():
+    # Arrange
+    received = []
+    watcher = Watcher({BaseNotification: recorder(received, "old")})
+    watcher.listen(BaseNotification())
+    watcher.listen(WatcherNotification())
+
+    # Act
+    watcher.notification_of_interest = {BaseNotification: recorder(received, "new")}
+    watcher.fallback_handler = recorder(received, "fallback")
+    watcher.listen(BaseNotification())
+    watcher.listen(WatcherNotification())
+
+    # Assert
+    assert received == ["old", "new", "fallback"]
+
+
+def test_pool_notices_assigned_fallback_handler_of_added_watcher():
+    # Arrange
+    received = []
+    watcher = Watcher()
+    pool = WatcherPool(base_topology=None).add(watcher)
+    pool.notify_all(InitializationNotification())
+
+    # Act
+    watcher.fallback_handler = recorder(received, "fallback")
+    pool.notify_all(InitializationNotification())
+
+    # Assert
+    assert received == ["fallback"]
+
+
+def test_handlers_cannot_be_changed_in_place():
+    # Arrange
+    received = []
+    handlers = {BaseNotification: recorder(received, "base")}
+    watcher = Watcher(handlers)
+    watcher.listen(DerivedNotification())
+
+    # Act
+    handlers[DerivedNotification] = recorder(received, "derived")
+    watcher.listen(DerivedNotification())
+
+    # Assert
+    assert received == ["base", "base"]
+    with pytest.raises(TypeError):
+        watcher.notification_of_interest[DerivedNotification] = recorder(
+            received, "derived"
+        )
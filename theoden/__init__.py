@@ -6,18 +6,33 @@ from .common import (
     MetricResponse,
     ResourceResponse,
 )
+import importlib
+
 from . import security as security
 from . import common as common
-from .resources import data as data
-from . import networking as net
-from . import datasets as datasets
-from . import topology as topology
-from . import operations as operations
-from . import models as models
-from . import watcher as watcher
 
 from .start import start_node, start_server, start_storage
 
+# Submodules that depend on the heavy ML stack are imported on first attribute access (PEP 562)
+_LAZY_SUBMODULES = {
+    "data": ".resources.data",
+    "net": ".networking",
+    "datasets": ".datasets",
+    "topology": ".topology",
+    "operations": ".operations",
+    "models": ".models",
+    "watcher": ".watcher",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(_LAZY_SUBMODULES[name], __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __version__ = "0.1.0"
 
 print(
@@ -1,4 +1,5 @@
 from .singleton import SingletonMeta
+from .background import BackgroundWorker
 from .global_context import GlobalContext
 from .metadata import Metadata
 from .typing import (
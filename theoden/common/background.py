@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Callable, Hashable
+
+# all workers, so a forked process can replace start locks that were held by other threads at the time of the fork
+_WORKERS: weakref.WeakSet[BackgroundWorker] = weakref.WeakSet()
+
+
+def _reset_start_locks() -> None:
+    for worker in _WORKERS:
+        worker._start_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_start_locks)
+
+
+class BackgroundWorker:
+    def __init__(
+        self,
+        process: Callable[[Any], None],
+        supersedes: Callable[[Any, Any], bool] | None = None,
+    ) -> None:
+        """Process items on a daemon thread in the order they were submitted.
+
+        The thread is started lazily in the process that submits the items, so a worker that is inherited by a forked
+        process starts its own thread there instead of relying on the thread of the parent.
+
+        Args:
+            process (Callable[[Any], None]): Called with every item on the thread. Exceptions are logged and do not stop the thread.
+            supersedes (Callable[[Any, Any], bool] | None, optional): Called with an item and the next pending item. If it returns True, the item is skipped. Defaults to None.
+        """
+        self._process = process
+        self._supersedes = supersedes
+        self._pid: int | None = None
+        # makes sure only one thread is started per process, if several threads submit the first items at once
+        self._start_lock = threading.Lock()
+        _WORKERS.add(self)
+
+    def _start(self) -> None:
+        # items pending in the parent process are processed there, not in a forked process
+        self._pending: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._available = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        threading.Thread(target=self._run, daemon=True).start()
+        # set last, as other threads only skip the start lock once the pid is set
+        self._pid = os.getpid()
+
+    def submit(self, item: Any, key: Hashable | None = None) -> None:
+        """Submit an item to be processed. Thread-safe.
+
+        Args:
+            item (Any): The item.
+            key (Hashable | None, optional): If an item with the same key is still pending, it is replaced by this item. Defaults to None.
+        """
+        if self._pid != os.getpid():
+            with self._start_lock:
+                if self._pid != os.getpid():
+                    self._start()
+        with self._lock:
+            self._pending[object() if key is None else key] = item
+            self._idle.clear()
+            self._available.set()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all submitted items are processed.
+
+        Args:
+            timeout (float | None, optional): The maximum time to wait in seconds. Defaults to None.
+
+        Returns:
+            bool: Whether all items were processed within the timeout.
+        """
+        if self._pid != os.getpid():
+            return True
+        return self._idle.wait(timeout)
+
+    @property
+    def num_pending(self) -> int:
+        """The number of items that are not processed yet in this process."""
+        return len(self._pending) if self._pid == os.getpid() else 0
+
+    def _run(self) -> None:
+        while True:
+            self._available.wait()
+            with self._lock:
+                if not self._pending:
+                    self._available.clear()
+                    self._idle.set()
+                    continue
+                item = self._pending.pop(next(iter(self._pending)))
+                if (
+                    self._supersedes is not None
+                    and self._pending
+                    and self._supersedes(item, next(iter(self._pending.values())))
+                ):
+                    continue
+
+            try:
+                self._process(item)
+            except Exception:
+                logging.exception("Exception while processing an item in the background")
@@ -1,16 +1,35 @@
 import multiprocessing
+import multiprocessing.managers
+import os
+from copy import deepcopy
 
 import yaml
 
 from .singleton import SingletonMeta
+from .utils import YAML_LOADER
+
+# parsed yaml files, keyed by path and modification time
+_YAML_CACHE: dict[tuple[str, float], dict] = {}
 
 
 class GlobalContext(metaclass=SingletonMeta):
+    """The global context of a process, usually loaded from a yaml file with `load_from_yaml()`.
+
+    A loaded context is a plain dict, which forked child processes inherit as a copy. The first `set()` starts a
+    manager process and moves the context into a dict shared with all processes forked afterwards, so values set by
+    a child are only seen by its parent if the parent has called `set()` before forking.
+    """
+
     def __init__(self):
-        self._manager = multiprocessing.Manager()
-        self._context: dict[str, any] = self._manager.dict()
+        # The manager process is only started once a value is set, as the context is usually loaded from yaml.
+        self._manager: multiprocessing.managers.SyncManager | None = None
+        self._context: dict[str, any] = {}
 
     def set(self, key: str, value: any):
+        if self._manager is None:
+            # share values set at runtime with the child processes
+            self._manager = multiprocessing.Manager()
+            self._context = self._manager.dict(self._context)
         self._context[key] = value
 
     def get(self, key: str, default: any = ...) -> any:
@@ -28,8 +47,18 @@ class GlobalContext(metaclass=SingletonMeta):
         self.set(key, value)
 
     def load_from_yaml(self, path: str):
-        with open(path, "r") as f:
-            self._context = yaml.load(f, Loader=yaml.FullLoader)
+        key = (os.path.abspath(path), os.path.getmtime(path))
+        if key not in _YAML_CACHE:
+            with open(path, "rb") as f:
+                _YAML_CACHE[key] = yaml.load(f, Loader=YAML_LOADER) or {}
+        # deep copy, so changing the context (also nested sections like `datasets`) does not change the cached file
+        context = deepcopy(_YAML_CACHE[key])
+        if self._manager is None:
+            self._context = context
+        else:
+            # keep sharing the context with the child processes, if it is already shared
+            self._context.clear()
+            self._context.update(context)
 
     def get_dataset_path(self, dataset: str, parameter_path: str | None = None) -> str:
         """Get the path to a dataset.
@@ -1,13 +1,23 @@
+from __future__ import annotations
+
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from .utils import none_return
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _pandas():
+    # pandas is only needed for the change log, so the common package can be imported without it
+    import pandas
+
+    return pandas
+
 
 class ChangeType(Enum):
     CREATED = 1
@@ -21,7 +31,9 @@ class Metadata(dict):
         super().__init__()
         self.logging = logging
         self.log = (
-            pd.DataFrame(columns=["time", "key", "value", "comment", "change_type"])
+            _pandas().DataFrame(
+                columns=["time", "key", "value", "comment", "change_type"]
+            )
             if logging
             else None
         )
@@ -37,6 +49,7 @@ class Metadata(dict):
         return False
 
     def _append_log(self, key: str, value: Any, change_type: ChangeType) -> None:
+        pd = _pandas()
         self.log = pd.concat(
             [
                 self.log,
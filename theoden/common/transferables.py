@@ -445,12 +445,16 @@ class Transferables(metaclass=SingletonMeta):
         Raises:
             TypeError: if the base type does not match the object's base type
         """
-        base_type_ = self[json_data["datatype"]].base_type
-        if base_type_ is None:
-            # if it is a base type, the base type is the class itself
-            base_type_ = self[json_data["datatype"]]
+        # look up the datatype only once
+        datatype_string: str = json_data["datatype"]
+        datatype = self._transferables.get(datatype_string)
+        if datatype is None:
+            raise ValueError(f"Datatype {datatype_string} is not registered.")
+
+        # if it is a base type, the base type is the class itself
+        base_type_ = datatype.base_type if datatype.base_type is not None else datatype
 
-        if base_type is not None and base_type_ not in Transferables():
+        if base_type is not None and base_type_ not in self:
             raise ValueError(f"Base type {base_type_} is not registered.")
 
         if base_type is not None and (
@@ -462,12 +466,6 @@ class Transferables(metaclass=SingletonMeta):
                 f"Expected object of with base_type '{base_type.__name__ if isinstance(base_type, type) else base_type}', got '{base_type_.__name__}'."
             )
 
-        datatype_string: str = json_data["datatype"]
-        if datatype_string not in Transferables():
-            raise ValueError(f"Datatype {datatype_string} is not registered.")
-
-        datatype = Transferables()[datatype_string]
-
         to_be_created = datatype if not datatype.implemented else datatype.implemented
 
         return to_be_created.init_from_dict(
@@ -602,11 +600,11 @@ def object_to_dict(obj) -> dict[str, any]:
         _dict["value"] = [object_to_dict(item) for item in obj]
     elif isinstance(obj, dict):
         _dict["value"] = {key: object_to_dict(value) for key, value in obj.items()}
-    elif type(obj) is type and obj in Transferables():
+    elif type(obj) is type and obj in _TRANSFERABLES:
         _dict["value"] = obj.__name__
         _dict["datatype"] = "registered_type"
     # If the object is of a registered type, call the 'dict' method and add the result to the dictionary
-    elif type(obj) in Transferables():
+    elif type(obj) in _TRANSFERABLES:
         _json = obj.dict()
         _dict["datatype"] = _json["datatype"]
         _dict["value"] = _json
@@ -646,28 +644,13 @@ def dict_to_object(
             value = object_dict["value"]
             type_name = object_dict["datatype"]
 
-            # Check the data type specified in the dictionary and convert to the correct type
-            if type_name == "int":
-                return int(value)
-            elif type_name == "float":
-                return float(value)
-            elif type_name == "str":
-                return str(value)
-            elif type_name == "bool":
-                return bool(value)
-            elif type_name == "NoneType":
-                return None
-            elif type_name == "list":
-                return [dict_to_object(item) for item in value]
-            elif type_name == "tuple":
-                return tuple([dict_to_object(item) for item in value])
-            elif type_name == "dict":
-                return {key: dict_to_object(value) for key, value in value.items()}
-            elif type_name == "registered_type":
-                return Transferables()[value]
+            # Convert builtin types with the decoder of their type name
+            decoder = _DECODERS.get(type_name)
+            if decoder is not None:
+                return decoder(value)
             # Check if the data type is registered and convert using the registered type
-            elif type_name in Transferables():
-                return Transferables().to_object(value).init_after_deserialization()
+            elif type_name in _TRANSFERABLES:
+                return _TRANSFERABLES.to_object(value).init_after_deserialization()
             else:
                 # Raise TypeError if the data type is not supported
                 raise TypeError("Unsupported data type: {}".format(type_name))
@@ -675,6 +658,23 @@ def dict_to_object(
             raise TypeError("Not a valid json type")
 
 
+# the singleton is fetched once, as every call of `Transferables()` acquires the singleton lock
+_TRANSFERABLES = Transferables()
+
+# decoders of the builtin datatypes written by `object_to_dict`, looked up by type name
+_DECODERS: dict[str, callable] = {
+    "int": int,
+    "float": float,
+    "str": str,
+    "bool": bool,
+    "NoneType": lambda value: None,
+    "list": lambda value: [dict_to_object(item) for item in value],
+    "tuple": lambda value: tuple([dict_to_object(item) for item in value]),
+    "dict": lambda value: {key: dict_to_object(item) for key, item in value.items()},
+    "registered_type": lambda value: _TRANSFERABLES[value],
+}
+
+
 def type_to_dict(type_: type) -> dict:
     """
     Convert a Python type to a dictionary representation.
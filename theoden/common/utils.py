@@ -3,7 +3,10 @@ import json
 from hashlib import sha224
 from typing import List
 
-import torch
+import yaml
+
+# use the C implementation of the yaml loader if libyaml is available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 IMAGENET_MEAN = [x / 255 for x in [125.3, 123.0, 113.9]]
 IMAGENET_STD = [x / 255 for x in [63.0, 62.1, 66.7]]
@@ -118,6 +121,9 @@ def calculate_min_max_mean_of_state_dict(
     Returns:
         tuple[float, float, float]: The minimum, maximum and mean of the state dict.
     """
+    # torch is only needed here, so the common package can be imported without it (e.g. by the storage server)
+    import torch
+
     vals = []
     for key in state_dict:
         vals.append(state_dict[key].flatten())
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import struct
+import time
+from collections import deque
+from multiprocessing import Semaphore, Value
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty, Full
+
+# Every message in the ring buffer is prefixed with its length as an unsigned 32-bit integer
+_LENGTH_PREFIX = struct.Struct("<I")
+
+
+class CommandQueue:
+    def __init__(self) -> None:
+        """A queue that hands commands from the network interface to the command loop inside a single process.
+
+        Commands can be put from any thread (e.g. the RabbitMQ consumer thread or a worker thread sending a pull request).
+        They are appended to a deque, which is thread-safe for appends and pops at both ends, and the event loop the
+        queue is attached to is woken up through an event.
+        """
+        self._commands: deque[dict] = deque()
+        self._available = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Attach the queue to the event loop of the command loop.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The event loop.
+        """
+        self._loop = loop
+
+    def put(self, command: dict) -> None:
+        """Put a command into the queue. Thread-safe.
+
+        Args:
+            command (dict): The command.
+
+        Raises:
+            RuntimeError: If the queue is not attached to an event loop.
+        """
+        if self._loop is None:
+            raise RuntimeError("The command queue is not attached to an event loop")
+        self._commands.append(command)
+        self._loop.call_soon_threadsafe(self._available.set)
+
+    def wake(self) -> None:
+        """Wake up a consumer waiting in `get_async()`. Thread-safe."""
+        # after the event loop has been closed, there is no consumer left to wake up
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._available.set)
+
+    async def get_async(self) -> dict | None:
+        """Wait for the next command.
+
+        Returns:
+            dict | None: The command or None, if the consumer was woken up without a command being available.
+        """
+        try:
+            return self._commands.popleft()
+        except IndexError:
+            pass
+        self._available.clear()
+        # a command might have been appended between the pop and clearing the event
+        if not self._commands:
+            await self._available.wait()
+        try:
+            return self._commands.popleft()
+        except IndexError:
+            return None
+
+    def get_nowait(self) -> dict:
+        """Get the next command without waiting.
+
+        Returns:
+            dict: The command.
+
+        Raises:
+            Empty: If no command is available.
+        """
+        try:
+            return self._commands.popleft()
+        except IndexError:
+            raise Empty("Command queue is empty")
+
+    def close(self, unlink: bool = False) -> None:
+        pass
+
+
+class SharedMemoryCommandQueue:
+    def __init__(self, size: int = 16 * 1024 * 1024, put_timeout: float = 10.0) -> None:
+        """A single-producer/single-consumer queue that hands commands from the network process to the
+        command process through a shared memory ring buffer.
+
+        Commands are stored as length-prefixed json bytes, so passing a command between the processes is a
+        memcpy instead of a pickle round-trip through a pipe or a manager process. The semaphore only counts
+        the available messages, the data itself is not locked. Additionally, the producer rings a doorbell pipe
+        after every put, which wakes up an asyncio consumer waiting in `wait()` without polling.
+
+        Args:
+            size (int, optional): The size of the ring buffer in bytes. Defaults to 16 MiB.
+            put_timeout (float, optional): The maximum time to wait for free space when putting a command. Defaults to 10.0.
+        """
+        self.size = size
+        self.put_timeout = put_timeout
+
+        self._shm = SharedMemory(create=True, size=size)
+        # total number of bytes written by the producer and read by the consumer
+        self._head = Value("Q", 0, lock=False)
+        self._tail = Value("Q", 0, lock=False)
+        # number of messages that are ready to be read
+        self._items = Semaphore(0)
+
+        # doorbell pipe to wake up the consumer's event loop. The event is created lazily inside the consumer process.
+        self._doorbell_read, self._doorbell_write = os.pipe()
+        os.set_blocking(self._doorbell_read, False)
+        os.set_blocking(self._doorbell_write, False)
+        self._available: asyncio.Event | None = None
+
+    def _write(self, position: int, data: bytes) -> None:
+        start = position % self.size
+        first = min(len(data), self.size - start)
+        self._shm.buf[start : start + first] = data[:first]
+        if first < len(data):
+            # wrap around to the beginning of the buffer
+            self._shm.buf[: len(data) - first] = data[first:]
+
+    def _read(self, position: int, length: int) -> bytes:
+        start = position % self.size
+        first = min(length, self.size - start)
+        data = bytes(self._shm.buf[start : start + first])
+        if first < length:
+            # wrap around to the beginning of the buffer
+            data += bytes(self._shm.buf[: length - first])
+        return data
+
+    def put(self, command: dict | bytes) -> None:
+        """Put a command into the queue. Must only be called by the producer process.
+
+        Args:
+            command (dict | bytes): The command as dict or as already encoded json bytes.
+
+        Raises:
+            ValueError: If the command is larger than the ring buffer.
+            Full: If there is not enough free space in the ring buffer within `put_timeout`.
+        """
+        payload = (
+            command if isinstance(command, bytes) else json.dumps(command).encode()
+        )
+        message = _LENGTH_PREFIX.pack(len(payload)) + payload
+
+        if len(message) > self.size:
+            raise ValueError(
+                f"Command of size {len(message)} does not fit into the command queue of size {self.size}"
+            )
+
+        # wait until the consumer has freed enough space
+        deadline = time.monotonic() + self.put_timeout
+        while self.size - (self._head.value - self._tail.value) < len(message):
+            if time.monotonic() > deadline:
+                raise Full("Command queue is full")
+            time.sleep(0.001)
+
+        self._write(self._head.value, message)
+        self._head.value += len(message)
+        self._items.release()
+        self._ring()
+
+    def _ring(self) -> None:
+        try:
+            os.write(self._doorbell_write, b"\0")
+        except BlockingIOError:
+            # the pipe is full, so the consumer has not yet been woken up by the previous rings
+            pass
+
+    def _on_doorbell(self) -> None:
+        # drain the pipe so the reader is only called again on the next ring
+        try:
+            while os.read(self._doorbell_read, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._available.set()
+
+    async def wait(self) -> None:
+        """Wait until the producer signals that new commands are available. Must only be called by the consumer process.
+
+        After this returns, all available commands should be drained with `get_nowait()`.
+        """
+        if self._available is None:
+            self._available = asyncio.Event()
+            asyncio.get_running_loop().add_reader(
+                self._doorbell_read, self._on_doorbell
+            )
+        await self._available.wait()
+        # clear before the caller drains the queue, so a put during draining triggers the next wakeup
+        self._available.clear()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> dict:
+        """Get the next command from the queue. Must only be called by the consumer process.
+
+        Args:
+            block (bool, optional): Whether to wait for a command. Defaults to True.
+            timeout (float | None, optional): The maximum time to wait for a command. Defaults to None.
+
+        Returns:
+            dict: The command.
+
+        Raises:
+            Empty: If no command is available.
+        """
+        if not self._items.acquire(block, timeout):
+            raise Empty("Command queue is empty")
+
+        tail = self._tail.value
+        (length,) = _LENGTH_PREFIX.unpack(self._read(tail, _LENGTH_PREFIX.size))
+        payload = self._read(tail + _LENGTH_PREFIX.size, length)
+        self._tail.value = tail + _LENGTH_PREFIX.size + length
+        return json.loads(payload)
+
+    def get_nowait(self) -> dict:
+        return self.get(block=False)
+
+    def wake(self) -> None:
+        """Wake up the consumer waiting in `wait()` or `get_async()`. Can be called from any process."""
+        self._ring()
+
+    async def get_async(self) -> dict | None:
+        """Wait for the next command without blocking the event loop. Must only be called by the consumer process.
+
+        Returns:
+            dict | None: The command or None, if the consumer was woken up without a command being available.
+        """
+        try:
+            return self.get_nowait()
+        except Empty:
+            pass
+        await self.wait()
+        try:
+            return self.get_nowait()
+        except Empty:
+            return None
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        # the doorbell is registered lazily in `wait()` on the loop of the consumer process
+        pass
+
+    def close(self, unlink: bool = False) -> None:
+        """Close the shared memory of this process.
+
+        Args:
+            unlink (bool, optional): Whether to also free the shared memory. Must only be done by the creating process. Defaults to False.
+        """
+        self._shm.close()
+        os.close(self._doorbell_read)
+        os.close(self._doorbell_write)
+        if unlink:
+            self._shm.unlink()
+
+
+command_queue_types = CommandQueue | SharedMemoryCommandQueue
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from abc import ABC, abstractmethod
+from multiprocessing.synchronize import Event
 
 from ..common import (
     ExecutionResponse,
@@ -10,13 +12,27 @@ from ..common import (
     UnauthorizedError,
 )
 from ..operations import PullCommandRequest, ServerRequest
+from .command_queue import command_queue_types
 
 
 class NodeInterface(ABC):
-    def __init__(self, command_queue: list[dict], ping_interval: float = 1.0):
+    # the first waiting time after a command as fraction of the ping interval and its growth per empty pull
+    backoff_base: float = 0.05
+    backoff_factor: float = 1.3
+    # seconds `stop()` waits for queued messages to be sent
+    flush_timeout: float = 10.0
+
+    def __init__(self, command_queue: command_queue_types, ping_interval: float = 1.0):
         self.command_queue = command_queue
         self.ping_interval = ping_interval
 
+        # set once `start()` is running, see `wait_until_started()`
+        self._started = threading.Event()
+
+        # set by `stop()` to interrupt the waiting of the request loop
+        self._request_loop: asyncio.AbstractEventLoop | None = None
+        self._stopped: asyncio.Event | None = None
+
     @abstractmethod
     def send_status_update(self, status_update: StatusUpdate) -> None:
         pass
@@ -25,24 +41,97 @@ class NodeInterface(ABC):
     def send_server_request(self, request: ServerRequest) -> ExecutionResponse:
         pass
 
-    async def start_request_loop(self) -> None:
-        while True:
-            # Wait for 1 second before making the next _pull() call
-            await asyncio.sleep(self.ping_interval)
+    def wait_until_started(self, timeout: float | None = None) -> bool:
+        """Wait until `start()` is running, so requests can be sent through the interface.
+
+        Args:
+            timeout (float | None, optional): The maximum time to wait in seconds. Defaults to None.
+
+        Returns:
+            bool: Whether the interface was started within the timeout.
+        """
+        return self._started.wait(timeout)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all status updates queued in this process are sent.
+
+        Args:
+            timeout (float | None, optional): The maximum time to wait in seconds. Defaults to None.
+
+        Returns:
+            bool: Whether all status updates were sent within the timeout.
+        """
+        return True
+
+    def stop(self) -> None:
+        """Stop the network interface started with `start()` and interrupt the waiting of the request loop."""
+        request_loop = self._request_loop
+        if request_loop is not None and not request_loop.is_closed():
+            request_loop.call_soon_threadsafe(self._stopped.set)
+
+    async def start_request_loop(self, stop_event: Event | None = None) -> None:
+        """Periodically pull commands from the server.
+
+        Args:
+            stop_event (Event | None, optional): The loop returns after the event is set. Defaults to None.
+        """
+        loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        self._request_loop = loop
+        waiting_level = 0
+        try:
+            while stop_event is None or not stop_event.is_set():
+                # Call the _pull method to get a server request from the server.
+                # The request is blocking, so it is sent from a worker thread to keep the event loop responsive.
+                received = await loop.run_in_executor(None, self._pull)
+
+                # If a command was received, the server likely has the next one ready soon, so pull again right away.
+                # Otherwise, back off exponentially until the ping interval is reached.
+                if received:
+                    waiting_level = 0
+                else:
+                    try:
+                        await asyncio.wait_for(
+                            self._stopped.wait(),
+                            timeout=self._waiting_time(waiting_level),
+                        )
+                        break
+                    except asyncio.TimeoutError:
+                        waiting_level += 1
+        finally:
+            # the event loop may be closed after this returns, so `stop()` must not schedule anything on it anymore
+            self._request_loop = None
+
+    def _waiting_time(self, waiting_level: int) -> float:
+        """Returns the time to wait before the next pull after `waiting_level` empty pulls in a row.
+
+        Args:
+            waiting_level (int): The number of empty pulls in a row.
+
+        Returns:
+            float: The time to wait in seconds, capped at the ping interval.
+        """
+        return min(
+            self.ping_interval,
+            self.ping_interval * self.backoff_base * self.backoff_factor**waiting_level,
+        )
 
-            # Call the _pull method to get a server request from the server
-            self._pull()
+    def _pull(self) -> bool:
+        """Pulls a command from the server and adds it to the command queue.
 
-    def _pull(self):
-        """Pulls a command from the server and adds it to the command queue."""
+        Returns:
+            bool: Whether a command was received.
+        """
         # Make a GET serverrequests to the server to get the next command
         try:
             response = self.send_server_request(PullCommandRequest())
 
             # If the response contains a command, parse it into a CommandModel object and add it to the command queue
             if response.data:
-                self.command_queue.append(response.get_data())
+                self.command_queue.put(response.get_data())
+                return True
         except ServerRequestError as e:
-            return
+            pass
         except UnauthorizedError as e:
             print("Unauthorized")
+        return False
@@ -2,20 +2,26 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
+import os
 import ssl
+import threading
+import time
+from concurrent.futures import Future
 from functools import partial
 from typing import TYPE_CHECKING
 
 import pika
 
 from ..common import (
-    ExecutionResponse,
+    BackgroundWorker,
+    ServerRequestError,
     StatusUpdate,
-    Transferable,
     Transferables,
     TransmissionStatusUpdate,
 )
 from ..operations import PullCommandRequest, ServerRequest
+from .command_queue import command_queue_types
 from .interface import NodeInterface
 from .storage import FileStorageInterface
 
@@ -27,12 +33,6 @@ def transform_dict(data: dict, request_form: str) -> bytes:
     return json.dumps({"message_type": request_form, "data": data}).encode()
 
 
-class ServerRequestResponse(Transferable, is_base_type=True):
-    def __init__(self, request_uuid: str, response: dict) -> None:
-        self.request_uuid = request_uuid
-        self.response = ExecutionResponse(**response)
-
-
 class ServerToMQInterface:
     def __init__(
         self,
@@ -127,7 +127,7 @@ class ServerToMQInterface:
         # check if serverrequest or status update
         try:
             node = self.server.topology.get_client_by_name(client_name)
-            if node.status == NodeStatus.OFFLINE:
+            if node.status is NodeStatus.OFFLINE:
                 self.server.topology.set_online(node.name)
         except KeyError:
             node = Node(
@@ -153,19 +153,17 @@ class ServerToMQInterface:
 
             server_response = self.server.process_server_request(request).dict()
 
-            response = ServerRequestResponse(
-                request_uuid=request.uuid,
-                response=server_response,
-            )
-
+            # the response is sent as plain json, so the node can read the command without reconstructing any objects
             self.channel.basic_publish(
                 exchange=f"{client_name}_exchange",
                 routing_key=f"{client_name}_client_queue",
                 body=transform_dict(
-                    response.dict(),
+                    {"request_uuid": request.uuid, "response": server_response},
                     "ServerRequestResponse",
                 ),
-                properties=pika.BasicProperties(delivery_mode=2),
+                # the client queues are not durable, so persisting the message to disk would not make it survive
+                # a broker restart and only slow down every pull
+                properties=pika.BasicProperties(delivery_mode=1),
             )
 
         elif response["message_type"] == "StatusUpdate":
@@ -191,9 +189,13 @@ class ServerToMQInterface:
 
 
 class ClientToMQInterface(NodeInterface):
+    # how often a failed status update is sent again and the delay before the first retry, doubled per retry
+    status_update_retries: int = 3
+    status_update_retry_delay: float = 0.5
+
     def __init__(
         self,
-        command_queue: list[dict],
+        command_queue: command_queue_types,
         host: str,
         port: int,
         username: str,
@@ -217,11 +219,27 @@ class ClientToMQInterface(NodeInterface):
         self.request_channel = self._build_connection(with_consume=True)
         self.execute_channel = self._build_connection()
 
-    def _build_connection(self, with_consume: bool = False) -> pika.channel.Channel:
+        # process and thread that consume the request channel (set in `start()`)
+        self._consumer: tuple[int, int] | None = None
+
+        # commands are pulled by the request loop and, while commands arrive, by `_on_response`. the request loop
+        # only pulls if no pull is outstanding and learns from `_command_received` that it can reset its backoff
+        self._command_received = threading.Event()
+        self._last_pull: float | None = None
+
+        # status updates are published by a background thread, so executing commands does not wait for the network
+        self._status_update_publisher = BackgroundWorker(
+            lambda item: self._publish_status_update_with_retries(*item)
+        )
+
+    def _build_connection(
+        self, with_consume: bool = False, purge: bool = True
+    ) -> pika.channel.Channel:
         """Builds a connection to the server.
 
         Args:
             with_consume (bool, optional): Whether to consume messages from the server. Defaults to False.
+            purge (bool, optional): Whether to purge the queues. Defaults to True.
 
         Returns:
             pika.channel.Channel: The channel.
@@ -263,15 +281,59 @@ class ClientToMQInterface(NodeInterface):
             )
 
         # Purge the queues to remove any old messages
-        channel.queue_purge(queue=self.client_queue_name)
-        channel.queue_purge(queue=self.server_queue_name)
+        if purge:
+            channel.queue_purge(queue=self.client_queue_name)
+            channel.queue_purge(queue=self.server_queue_name)
 
         return channel
 
     def start(self):
-        self.request_channel.start_consuming()
+        # from now on, requests of other threads are published by this thread
+        self._consumer = (os.getpid(), threading.get_ident())
+        self._started.set()
+        try:
+            self.request_channel.start_consuming()
+        finally:
+            self._consumer = None
+
+    def flush(self, timeout: float | None = None) -> bool:
+        if self._status_update_publisher.flush(timeout):
+            return True
+        logging.warning(
+            "%d status updates could not be sent within %s seconds",
+            self._status_update_publisher.num_pending,
+            timeout,
+        )
+        return False
+
+    def stop(self):
+        # send the last status updates before the node exits
+        self.flush(timeout=self.flush_timeout)
+        super().stop()
+
+        # stop consuming on the consuming thread, as pika connections are not thread-safe
+        if self._consumer is None:
+            return
+        if self._consumer == (os.getpid(), threading.get_ident()):
+            self.request_channel.stop_consuming()
+        elif self._consumer[0] == os.getpid():
+            self.request_channel.connection.add_callback_threadsafe(
+                self.request_channel.stop_consuming
+            )
+
+    def _pull(self) -> bool:
+        # the response arrives asynchronously in `_on_response`, which pulls again if it contained a command. the
+        # request loop does not send a second pull while one is outstanding, unless its response got lost
+        last_pull = self._last_pull
+        if last_pull is None or time.monotonic() - last_pull > self.ping_interval:
+            self._send_pull()
 
-    def _pull(self):
+        received = self._command_received.is_set()
+        self._command_received.clear()
+        return received
+
+    def _send_pull(self) -> None:
+        self._last_pull = time.monotonic()
         self.send_server_request(PullCommandRequest())
 
     def add_storage_interface(self, storage_interface: FileStorageInterface) -> None:
@@ -294,15 +356,15 @@ class ClientToMQInterface(NodeInterface):
         message_type = response["message_type"]
 
         if message_type == "ServerRequestResponse":
-            # Get the request uuid
-            response = Transferables().to_object(
-                response["data"],
-                ServerRequestResponse,
-            )
-
-            # if the response contains a new command, add it to the command queue
-            if response.response.data:
-                self.command_queue.append(response.response.data)
+            # if the response contains a new command, add it to the command queue.
+            # The command stays a parsed json dict and is only converted to a Command by the command loop.
+            command = response["data"]["response"]["data"]
+            self._last_pull = None
+            if command:
+                self.command_queue.put(command)
+                self._command_received.set()
+                # the server likely has the next command ready soon, so pull again right away
+                self._send_pull()
 
     def send_server_request(self, request: ServerRequest) -> None:
         """Publishes a server request to the server queue.
@@ -311,28 +373,80 @@ class ClientToMQInterface(NodeInterface):
             request (ServerRequest): The server request to send.
         """
 
-        self.request_channel.basic_publish(
+        publish = partial(
+            self.request_channel.basic_publish,
             exchange=f"{self.node_name}_exchange",
             routing_key=self.server_queue_name,
             body=transform_dict(request.dict(), "ServerRequest"),
         )
 
-    def send_status_update(self, status_update: StatusUpdate) -> None:
-        """Sends a status update to the server.
+        # pika connections are not thread-safe. If the request channel is consumed by another thread of
+        # this process, the publish has to be scheduled on the consuming thread.
+        if (
+            self._consumer is not None
+            and self._consumer[0] == os.getpid()
+            and self._consumer[1] != threading.get_ident()
+        ):
+            self.request_channel.connection.add_callback_threadsafe(publish)
+        else:
+            publish()
+
+    def send_status_update(self, status_update: StatusUpdate) -> Future[None]:
+        """Queues a status update to be sent to the server by the publisher thread.
 
         Args:
             status_update (StatusUpdate): The status update to send.
+
+        Returns:
+            Future[None]: Completed once the status update is sent. If it could not be sent, the future raises a
+                `ServerRequestError` with the cause of the last attempt.
         """
 
+        # Read the files now, as they might be changed by the next commands
+        files = (
+            status_update.response.get_files() if status_update.contains_files() else {}
+        )
+
+        sent = Future()
+        self._status_update_publisher.submit((status_update, files, sent))
+        return sent
+
+    def _publish_status_update_with_retries(
+        self,
+        status_update: StatusUpdate,
+        files: dict[str, bytes],
+        sent: Future[None],
+    ) -> None:
+        for retry in range(self.status_update_retries + 1):
+            try:
+                # a closed channel cannot be used anymore, the queues are not purged to keep the pending messages
+                if self.execute_channel.is_closed:
+                    self.execute_channel = self._build_connection(purge=False)
+                self._publish_status_update(status_update, files)
+                sent.set_result(None)
+                return
+            except Exception as e:
+                if retry == self.status_update_retries:
+                    logging.error(
+                        "Could not send status update of command %s: %s",
+                        status_update.command_uuid,
+                        e,
+                    )
+                    error = ServerRequestError(f"Could not send status update: {e}")
+                    error.__cause__ = e
+                    sent.set_exception(error)
+                    return
+                logging.warning("Could not send status update, retrying: %s", e)
+                time.sleep(self.status_update_retry_delay * 2**retry)
+
+    def _publish_status_update(
+        self, status_update: StatusUpdate, files: dict[str, bytes]
+    ) -> None:
         resource_uuids = {}
 
         # Upload all files in the status update
-        if status_update.contains_files():
-            resource_uuids.update(
-                self.storage_interface.upload_resources(
-                    status_update.response.get_files(),
-                )
-            )
+        if files:
+            resource_uuids.update(self.storage_interface.upload_resources(files))
 
         # publish status update in the server queue
         self.execute_channel.basic_publish(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Annotated
 
 import fastapi
@@ -9,6 +10,8 @@ from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from jose import jwt
+from requests.adapters import HTTPAdapter
 
 from ..common import (
     ExecutionResponse,
@@ -24,6 +27,7 @@ from ..operations import *
 from ..security import create_access_token, decode_token
 from ..security.auth import AuthenticationManager, UserRole
 from ..topology.topology import Node, NodeStatus, NodeType, Topology
+from .command_queue import command_queue_types
 from .interface import NodeInterface
 from .storage import FileStorageInterface
 
@@ -64,7 +68,7 @@ class RestServerInterface(FastAPI):
             error_message_str = "\n".join(error_messages)
 
             # Log the error message
-            logging.error(f"{request}: {error_message_str}")
+            logging.error("%s: %s", request, error_message_str)
 
             # Create a response with more details
             content = {
@@ -202,7 +206,7 @@ class RestServerInterface(FastAPI):
 class RestNodeInterface(NodeInterface):
     def __init__(
         self,
-        command_queue: list[dict],
+        command_queue: command_queue_types,
         address: str = "localhost",
         port: int = 8000,
         https: bool = False,
@@ -224,16 +228,43 @@ class RestNodeInterface(NodeInterface):
         self.port = port
         self.https = https
 
+        # reuse connections for all requests to the server instead of doing a new TCP (and TLS) handshake per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, pool_block=False)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         # get the token from the server using the username and password. This will be used for authentication.
-        self.token = self.request_token(username=username, password=password)
+        # The credentials are kept to request a new token shortly before the current one expires.
+        self._credentials = (username, password)
+        self.storage_interface: FileStorageInterface | None = None
+        self.set_token(self.request_token(username=username, password=password))
 
     def start(self):
-        pass
+        self._started.set()
 
     def add_storage_interface(self, storage_interface: FileStorageInterface) -> None:
         self.storage_interface = storage_interface
         self.storage_interface.set_token(self.token)
 
+    def set_token(self, token: str) -> None:
+        """Set the authentication token and remember when it expires.
+
+        Args:
+            token (str): The authentication token.
+        """
+        self.token = token
+        self._token_expiry = jwt.get_unverified_claims(token).get("exp")
+        if self.storage_interface is not None:
+            self.storage_interface.set_token(token)
+
+    @property
+    def _auth_headers(self) -> dict[str, str]:
+        # only request a new token if the current one is about to expire
+        if self._token_expiry is not None and time.time() > self._token_expiry - 30:
+            self.set_token(self.request_token(*self._credentials))
+        return {"Authorization": f"Bearer {self.token}"}
+
     def request_token(self, username: str = "", password: str = "") -> str:
         """Request a token from the server.
 
@@ -246,7 +277,7 @@ class RestNodeInterface(NodeInterface):
         """
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{'https' if self.https else 'http'}://{self.address}:{self.port}/token",
                 data={"username": username, "password": password},
             )
@@ -271,10 +302,10 @@ class RestNodeInterface(NodeInterface):
                     )
                 )
 
-            response = requests.post(
+            response = self.session.post(
                 f"{'https' if self.https else 'http'}://{self.address}:{self.port}/status",
                 json=status_update.unload(resource_uuids).dict(),
-                headers={"Authorization": f"Bearer {self.token}"},
+                headers=self._auth_headers,
             )
 
         except requests.exceptions.ConnectionError as e:
@@ -297,10 +328,10 @@ class RestNodeInterface(NodeInterface):
         """
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{'https' if self.https else 'http'}://{self.address}:{self.port}/serverrequest",
                 json=request.dict(),
-                headers={"Authorization": f"Bearer {self.token}"},
+                headers=self._auth_headers,
             )
 
             if response.status_code == 401:
@@ -11,6 +11,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
 
 from ..common import UnauthorizedError
 from ..security.auth import AuthenticationManager, UserRole
@@ -50,7 +51,7 @@ class FileStorage(FastAPI):
             request: Request, exc: RequestValidationError
         ):
             exc_str = f"{exc}".replace("\n", " ").replace("   ", " ")
-            logging.error(f"{request}: {exc_str}")
+            logging.error("%s: %s", request, exc_str)
             content = {"status_code": 10422, "message": exc_str, "data": None}
             return JSONResponse(
                 # content=jsonable_encoder({"detail": exc.errors(), "body": exc.body}),
@@ -196,6 +197,12 @@ class FileStorageInterface:
         self.port = port
         self.https = https
 
+        # reuse connections for all uploads and downloads instead of doing a new TCP (and TLS) handshake per file
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         self.set_token(self.request_token(username, password))
 
     def set_token(self, token: str) -> None:
@@ -221,7 +228,7 @@ class FileStorageInterface:
         if self.storage is not None:
             return "dummy"
 
-        response = requests.post(
+        response = self.session.post(
             f"{'https' if self.https else 'http'}://{self.address}:{self.port}/storage-token",
             data={"username": username, "password": password},
         )
@@ -268,7 +275,7 @@ class FileStorageInterface:
             for file_name, file_content in files.items()
         ]
 
-        response = requests.post(
+        response = self.session.post(
             f"{'https' if self.https else 'http'}://{self.address}:{self.port}/file",
             files=files,
             data={"is_server_only": is_server_only},
@@ -293,7 +300,7 @@ class FileStorageInterface:
         if self.token is None:
             raise ValueError("No token provided")
 
-        response = requests.get(
+        response = self.session.get(
             f"{'https' if self.https else 'http'}://{self.address}:{self.port}/file/{file_uuid}",
             headers={"Authorization": f"Bearer {self.token}"},
         )
@@ -315,7 +322,7 @@ class FileStorageInterface:
         if self.token is None:
             raise ValueError("No token provided")
 
-        requests.delete(
+        self.session.delete(
             f"{'https' if self.https else 'http'}://{self.address}:{self.port}/file/{file_uuid}",
             headers={"Authorization": f"Bearer {self.token}"},
         )
@@ -607,7 +607,7 @@ class OpenDistribution(Distribution):
         if node_name not in self.dist_table:
             self.dist_table.add_node(node_name, command_uuids=[self.commands[0].uuid])
         # if a node is removed from the topology, remove it from the instruction
-        if topology.get_client_by_name(node_name).status == NodeStatus.OFFLINE:
+        if topology.get_client_by_name(node_name).status is NodeStatus.OFFLINE:
             del self.dist_table[node_name]
 
 
@@ -685,6 +685,6 @@ class ClosedDistribution(Distribution):
         if node_name not in self.dist_table:
             return
         # if a node is removed from the topology, remove it from the instruction
-        if topology.get_client_by_name(node_name).status == NodeStatus.OFFLINE:
+        if topology.get_client_by_name(node_name).status is NodeStatus.OFFLINE:
             self.dist_table[node_name] = None
             self._check_for_finish(topology, resource_manager)
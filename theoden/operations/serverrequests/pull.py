@@ -17,6 +17,9 @@ class PullCommandRequest(ServerRequest, Transferable):
     It is the main request used by the nodes communicating with the server and the tool to distribute commands to the nodes.
     """
 
+    # nodes pull continuously, so notifying the watchers about every pull would only add work to the hot path
+    notify_watchers = False
+
     def __init__(self, uuid: None | str = None, **kwargs):
         """A request to pull a command from the server.
 
@@ -37,9 +40,8 @@ class PullCommandRequest(ServerRequest, Transferable):
             self.server.operations[0], InstructionBundle
         ):
             # if the next operation is an instruction set, we need to unpack it and add it to the operations list as separate instructions
-            self.server.operations = (
-                self.server.operations[0].instructions + self.server.operations[1:]
-            )
+            bundle = self.server.operations.popleft()
+            self.server.operations.extendleft(reversed(bundle.instructions))
         return self.server.operations[0] if self.server.operations else None
 
     def execute(self) -> ExecutionResponse | None:
@@ -48,46 +50,53 @@ class PullCommandRequest(ServerRequest, Transferable):
         Returns:
             dict: The command to be executed by the node.
         """
+        # The operation head is only looked up again after the operations list changed
+        head = self.operation_head
+
         # If there are no operations, return an empty dictionary
-        if not self.operation_head:
+        if not head:
             return ExecutionResponse(data={})
 
         # If the operation head is a condition, check if it is resolved. If it is, pop it from the operations list and continue
-        while isinstance(self.operation_head, Condition):
+        while isinstance(head, Condition):
             # If the condition is not resolved, return an empty dictionary
-            if not self.operation_head.resolved(
+            if not head.resolved(
                 topology=self.server.topology,
                 resource_manager=self.server.resources,
             ):
                 return ExecutionResponse(data={})
             # If the condition is resolved, pop it from the operations list and continue
             else:
-                self.server.history.append(self.server.operations.pop(0))
+                self.server.history.append(self.server.operations.popleft())
+                head = self.operation_head
 
-        if isinstance(self.operation_head, Instruction):
-            if self.operation_head.status is InstructionStatus.COMPLETED:
+        if isinstance(head, Instruction):
+            if head.status is InstructionStatus.COMPLETED:
                 # If the instruction is completed, check if it has a successor. If it does, add it to the operations list
-                successor = self.operation_head.successor
-                self.server.history.append(self.server.operations.pop(0))
+                successor = head.successor
+                self.server.history.append(self.server.operations.popleft())
                 if successor is not None and isinstance(successor, list):
-                    self.server.operations = successor + self.server.operations
+                    self.server.operations.extendleft(reversed(successor))
+                head = self.operation_head
 
             # Infer the command from the instruction and return it as a dictionary
-            if not self.operation_head:
+            if not head:
                 return ExecutionResponse(data={})
 
         # If the operation head is an instruction, check if it is completed. If it is, pop it from the operations list and continue
-        if isinstance(self.operation_head, Distribution):
-            command = self.operation_head.infer_command(
+        if isinstance(head, Distribution):
+            command = head.infer_command(
                 node_name=self.node_name,
                 topology=self.server.topology,
                 resource_manager=self.server.resources,
             )
             return ExecutionResponse(data=command.dict() if command is not None else {})
 
-        elif isinstance(self.operation_head, Action):
-            if self.operation_head.status is InstructionStatus.CREATED:
-                self.operation_head(
+        elif isinstance(head, Action):
+            if head.status is InstructionStatus.CREATED:
+                # the action is performed inside the request, as it changes the topology and resources like the
+                # request and status update handlers, which do not lock them
+                head(
                     topology=self.server.topology,
                     resource_manager=self.server.resources,
                 )
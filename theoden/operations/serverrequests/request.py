@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 
 
 class ServerRequest(ABC, Transferable, is_base_type=True):
+    # whether the server notifies its watchers about requests of this type
+    notify_watchers: bool = True
+
     def __init__(
         self,
         uuid: None | str = None,
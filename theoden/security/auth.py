@@ -6,8 +6,8 @@ from uuid import UUID, uuid4
 import requests
 import yaml
 
-from ..common import UnauthorizedError
-from .hash import hash_value, verify_hash
+from ..common import YAML_LOADER, UnauthorizedError
+from .hash import hash_value, verify_dummy_hash, verify_hash
 
 
 class UserRole(Enum):
@@ -34,6 +34,8 @@ class AuthenticationManager:
         # Initialize an empty dictionary to store user information.
         self.users: dict[str, User] = {}
         self.simulation = simulation
+        # hash of the password of simulated users, computed on first use
+        self._dummy_password_hash: str | None = None
 
         # Load user data from a YAML file if provided
         if yaml_file is not None:
@@ -102,12 +104,18 @@ class AuthenticationManager:
             else:
                 raise UnauthorizedError("Authentication failed. Incorrect password.")
         else:
+            verify_dummy_hash()
             raise UnauthorizedError("Authentication failed. User not found.")
 
     def get_user_by_name(self, username: str) -> User | None:
         # If simulation is True, then all users are authenticated and created if they do not exist.
         if self.simulation and username not in self.users:
-            return self.register_user(str(uuid4()), "dummy", UserRole.CLIENT)
+            # hashing is deliberately slow, so the same hash is reused for all simulated users
+            if self._dummy_password_hash is None:
+                self._dummy_password_hash = hash_value("dummy")
+            return self.register_user(
+                str(uuid4()), self._dummy_password_hash, UserRole.CLIENT, is_hashed=True
+            )
 
         # return user if exists else return None
         return self.users.get(username, None)
@@ -134,8 +142,8 @@ class AuthenticationManager:
         Args:
             yaml_file (str): The path to the YAML file containing user data.
         """
-        with open(yaml_file, "r") as file:
-            users_data = yaml.safe_load(file)
+        with open(yaml_file, "rb") as file:
+            users_data = yaml.load(file, Loader=YAML_LOADER)
 
         if users_data is not None:
             for user in users_data:
@@ -154,8 +162,8 @@ class AuthenticationManager:
         api_password: str = "guest",
         vhost: str = "",
     ):
-        with open(yaml_file, "r") as file:
-            users = yaml.safe_load(file)
+        with open(yaml_file, "rb") as file:
+            users = yaml.load(file, Loader=YAML_LOADER)
 
         if create_users:
             vhost_url = f"{api_url}/api/vhosts/{vhost}"
@@ -27,3 +27,11 @@ def verify_hash(plain: str | bytes, hashed: str | bytes) -> bool:
         bool: True if the hashed value matches the plain value.
     """
     return pwd_context.verify(plain, hashed)
+
+
+def verify_dummy_hash() -> None:
+    """Spend the same time as verifying a hash, without a hash to verify against.
+
+    Used when a user does not exist, so the response time does not reveal which usernames exist.
+    """
+    pwd_context.dummy_verify()
@@ -18,6 +18,12 @@ class OperationWhiteList:
         """
         self.operations = operations
 
+        # precompute the lookup sets, so checking an operation is a single set lookup
+        self._operation_types = frozenset(operations)
+        self._operation_names = frozenset(
+            operation.__name__ for operation in operations
+        )
+
     def allows(
         self,
         item: type[operations_types] | list[operations_types] | operations_types | str,
@@ -32,13 +38,13 @@ class OperationWhiteList:
         """
 
         if isinstance(item, str):
-            return any([item == operation.__name__ for operation in self.operations])
+            return item in self._operation_names
         elif isinstance(item, list):
             return all([self.allows(type(operation)) for operation in item])
         elif isinstance(item, type):
-            return item in self.operations
+            return item in self._operation_types
         else:
-            return type(item) in self.operations
+            return type(item) in self._operation_types
 
 
 class OperationBlackList(OperationWhiteList):
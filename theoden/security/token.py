@@ -1,12 +1,13 @@
 from datetime import datetime, timedelta
-from secrets import token_hex
+from secrets import token_bytes
 
 from jose import ExpiredSignatureError, JWTError, jwt
 
 from ..common import UnauthorizedError
 
-# create a secret key for signing the JWT
-SECRET_KEY = token_hex(32)
+# create a secret key for signing the JWT. The raw bytes are passed to the HMAC directly,
+# so no str -> bytes encoding is needed on every sign/verify.
+SECRET_KEY = token_bytes(32)
 
 # Define the algorithm used to sign the JWT
 ALGORITHM = "HS256"
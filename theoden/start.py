@@ -1,18 +1,34 @@
+from __future__ import annotations
+
+import importlib
 import logging
 import ssl
 from getpass import getpass
+from typing import TYPE_CHECKING
 
 import uvicorn
 
 from .common import GlobalContext
-from .datasets import *
-from .models import *
 from .networking import FileStorage
-from .operations import *
-from .resources import *
-from .topology import *
-from .topology.node import Node
-from .topology.server import Server
+
+if TYPE_CHECKING:
+    from .operations import Condition, Instruction, InstructionBundle
+
+# Modules that register the transferable classes (commands, instructions, datasets, models, ...).
+# They are only imported when a node or server is started, as they pull in the heavy ML dependencies.
+_TRANSFERABLE_MODULES = (
+    ".datasets",
+    ".models",
+    ".operations",
+    ".resources",
+    ".topology",
+)
+
+
+def _register_transferables() -> None:
+    """Import all modules that register transferable classes."""
+    for module in _TRANSFERABLE_MODULES:
+        importlib.import_module(module, __package__)
 
 
 def start_node(
@@ -28,6 +44,9 @@ def start_node(
     ssl: bool = False,
     ssl_context: ssl.SSLContext | None = None,
 ):
+    _register_transferables()
+    from .topology.node import Node
+
     GlobalContext().load_from_yaml(global_context)
     if username != "dummy" and password == "dummy":
         password = getpass("Password: ")
@@ -79,6 +98,9 @@ def start_server(
     ssl_context: ssl.SSLContext | None = None,
     https: bool = False,
 ):
+    _register_transferables()
+    from .topology.server import Server
+
     GlobalContext().load_from_yaml(global_context)
 
     logging.basicConfig(level=logging.WARNING)
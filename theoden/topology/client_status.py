@@ -1,10 +1,12 @@
+import heapq
 import logging
 import time
 from abc import ABC, abstractmethod
+from threading import Condition
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .topology import Topology
+    from .topology import Node, Topology
 
 
 class ClientStatusObserver(ABC):
@@ -12,20 +14,67 @@ class ClientStatusObserver(ABC):
     def observe(self, topology: "Topology"):
         raise NotImplementedError("ClientStatusObserver.observe() is not implemented")
 
+    def watch(self, node: "Node") -> None:
+        """Called by the topology when a node comes online or is added as online.
+
+        Args:
+            node (Node): The node that came online.
+        """
+        pass
+
 
 class TimeoutClientStatusObserver(ClientStatusObserver):
-    def __init__(self, timeout: float = 3.0, sleep: float = 1.0) -> None:
+    def __init__(self, timeout: float = 3.0, sleep: float | None = None) -> None:
+        """Set clients offline if they have not been active for `timeout` seconds.
+
+        The observer keeps a min-heap of the deadlines of all online clients and only wakes up when the next
+        deadline expires. A client that was active in the meantime is pushed back with its new deadline.
+
+        Args:
+            timeout (float, optional): The time in seconds after which an inactive client is set offline. Defaults to 3.0.
+            sleep (float | None, optional): Unused, as the observer no longer polls. Only kept for compatibility. Defaults to None.
+        """
         self.timeout = timeout
-        self.sleep = sleep
+        self._deadlines: list[tuple[float, str]] = []
+        self._condition = Condition()
+
+    def watch(self, node: "Node") -> None:
+        with self._condition:
+            heapq.heappush(
+                self._deadlines, (node.last_active + self.timeout, node.name)
+            )
+            self._condition.notify()
 
     def observe(self, topology: "Topology"):
         from .topology import NodeStatus
 
+        timeout = self.timeout
+
+        with self._condition:
+            for node in topology.online_clients():
+                heapq.heappush(self._deadlines, (node.last_active + timeout, node.name))
+
         while True:
-            for node in topology.clients:
-                if node.status == NodeStatus.ONLINE:
-                    if node.last_active + self.timeout < time.time():
-                        topology.set_offline(node.name)
-                        logging.warning(f"Client {node.name} timed out")
+            with self._condition:
+                # sleep until the next deadline expires or a new client comes online
+                while not self._deadlines or self._deadlines[0][0] > time.monotonic():
+                    self._condition.wait(
+                        self._deadlines[0][0] - time.monotonic()
+                        if self._deadlines
+                        else None
+                    )
+                _, node_name = heapq.heappop(self._deadlines)
+
+            # the node might have been removed from the topology in the meantime
+            node = topology.nodes.get(node_name)
+            if node is None or node.status is not NodeStatus.ONLINE:
+                continue
 
-            time.sleep(self.sleep)
+            deadline = node.last_active + timeout
+            if deadline > time.monotonic():
+                # the client was active in the meantime
+                with self._condition:
+                    heapq.heappush(self._deadlines, (deadline, node_name))
+            else:
+                topology.set_offline(node)
+                logging.warning("Client %s timed out", node.name)
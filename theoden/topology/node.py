@@ -1,7 +1,14 @@
 # import torch.multiprocessing as mp
 import asyncio
+import logging
+import multiprocessing
+import os
 import ssl
-from multiprocessing import Manager, Process
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.process import BaseProcess
+from queue import Empty
 
 import requests
 
@@ -9,9 +16,14 @@ from ..common import (
     ForbiddenOperationError,
     ServerRequestError,
     StatusUpdate,
-    Transferables,
     UnauthorizedError,
 )
+from ..common.transferables import _TRANSFERABLES
+from ..networking.command_queue import (
+    CommandQueue,
+    SharedMemoryCommandQueue,
+    command_queue_types,
+)
 from ..networking.rabbitmq import ClientToMQInterface
 from ..networking.rest import RestNodeInterface
 from ..networking.storage import FileStorageInterface
@@ -19,8 +31,22 @@ from ..operations import Command, ServerRequest
 from ..resources.resource import ResourceManager
 from ..security.operation_protection import OperationBlackList, OperationWhiteList
 
+# Forked children inherit the node instead of unpickling it, so interfaces and resources do not have to be picklable.
+# The shared memory command queue also relies on inherited pipes and `loop.add_reader`, so the multiprocess mode needs
+# fork. It is not used on macOS, where forking is unsafe and spawn is the default.
+_MP_CONTEXT = (
+    multiprocessing.get_context("fork")
+    if "fork" in multiprocessing.get_all_start_methods() and sys.platform != "darwin"
+    else None
+)
+
 
 class Node:
+    # maximum number of commands that are taken from the command queue per wakeup
+    command_batch_size: int = 64
+    # seconds to wait for the processes to exit on their own before they are terminated
+    shutdown_timeout: float = 5.0
+
     def __init__(
         self,
         communication_address: str = "localhost",
@@ -34,6 +60,8 @@ class Node:
         ssl: bool = False,
         ssl_context: ssl.SSLContext | None = None,
         operation_protection: OperationWhiteList | OperationBlackList | None = None,
+        multiprocess: bool = False,
+        request_loop_cpu: int | None = None,
     ) -> None:
         """A federated learning node.
 
@@ -47,15 +75,32 @@ class Node:
             ping_interval (float, optional): The interval at which the node will ping the server. Defaults to 1.0.
             rabbitmq (bool, optional): Whether to use RabbitMQ for communication. Defaults to True.
             operation_protection (OperationWhiteList | OperationBlackList | None, optional): A list of operations that the node is allowed to execute. Defaults to None.
+            multiprocess (bool, optional): Whether to run the command loop and the request loop in separate processes. Requires the fork start method, so it is not supported on Windows and macOS. Defaults to False.
+            request_loop_cpu (int | None, optional): In multiprocess mode, pin the request loop process to this CPU and the command process to all other CPUs. Only supported on Linux. Defaults to None.
+
+        Raises:
+            ValueError: If `multiprocess` is set on a platform without the fork start method.
         """
+        if multiprocess and _MP_CONTEXT is None:
+            raise ValueError(
+                f"The multiprocess mode requires the fork start method, which is not supported on {sys.platform}"
+            )
 
         # Initialize the command queue and resource register as empty dictionaries
         self.uuid: str | None = None
         self.ping_interval = ping_interval
         self.operation_protection = operation_protection
+        self.multiprocess = multiprocess
+        self.request_loop_cpu = request_loop_cpu
+
+        # Initialize the command queue. This will hold all the commands that the node has to execute.
+        # In multiprocess mode, the queue is filled by the network process and consumed by the command process through shared memory.
+        self.command_queue: command_queue_types = (
+            SharedMemoryCommandQueue() if multiprocess else CommandQueue()
+        )
 
-        # Initialize the command queue as a list. This will hold all the commands that the node has to execute.
-        self.command_queue: list[dict] = Manager().list([])
+        # Commands are executed one after another in a worker thread, so the event loop stays responsive for the network
+        self._executor = ThreadPoolExecutor(max_workers=1)
 
         # Initialize the resource register. This will hold all the resource_manager that are required for the commands.
         self.resources: ResourceManager = ResourceManager(
@@ -94,28 +139,72 @@ class Node:
         self.network_interface.add_storage_interface(self.resources.storage)
 
         # Initialize the processes as an empty list
-        self.processes: list[Process] = []
+        self.processes: list[BaseProcess] = []
+
+        # Set to shut down the command loop and the request loop cooperatively
+        self.stop_event = _MP_CONTEXT.Event() if multiprocess else threading.Event()
 
-    def _run_node(self, fn):
+    def _run_node(self, fn, *args):
         # Run an async function in an event loop
-        asyncio.run(fn())
+        asyncio.run(fn(*args))
+        # the status updates are sent by the command process, which exits without running `stop()`
+        self.network_interface.flush(timeout=self.network_interface.flush_timeout)
 
     def start(self):
         """Start the node.
 
-        This method will register the node with the server and start the command queue and serverrequests queue.
+        This method will start the command queue and serverrequests queue. By default, both run as tasks in a single event loop.
         """
+        if self.multiprocess:
+            self._start_processes()
+            return
+
+        try:
+            asyncio.run(self._main())
+        except KeyboardInterrupt:
+            self.stop()
+
+    async def _main(self) -> None:
+        loop = asyncio.get_running_loop()
+        self.command_queue.attach(loop)
 
+        # The network interface might block (e.g. RabbitMQ consuming), so it is started in a worker thread.
+        # The request loop only starts pulling once the interface is started, as the pulls are sent through it.
+        network = loop.run_in_executor(None, self.network_interface.start)
+        try:
+            await asyncio.wait(
+                [
+                    network,
+                    loop.run_in_executor(
+                        None, self.network_interface.wait_until_started
+                    ),
+                ],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            await asyncio.gather(
+                self.start_command_queue(),
+                self.network_interface.start_request_loop(self.stop_event),
+                network,
+            )
+        finally:
+            # Stop the loops and the network interface while the event loop is still running.
+            # On exit, asyncio waits for the worker threads, and only `stop()` ends a blocking network interface.
+            self.stop_event.set()
+            self.command_queue.wake()
+            self.network_interface.stop()
+
+    def _start_processes(self):
         # Create two separate processes to execute command queue and serverrequests queue
         # target is the function to be called by the process
         # args is the arguments to be passed to the function
 
         try:
-            command_process = Process(
+            command_process = _MP_CONTEXT.Process(
                 target=self._run_node, args=(self.start_command_queue,)
             )
-            request_process = Process(
-                target=self._run_node, args=(self.network_interface.start_request_loop,)
+            request_process = _MP_CONTEXT.Process(
+                target=self._run_node,
+                args=(self.network_interface.start_request_loop, self.stop_event),
             )
 
             # Append the processes to the processes list
@@ -124,6 +213,7 @@ class Node:
             # Start the processes
             command_process.start()
             request_process.start()
+            self._pin_processes(command_process, request_process)
             self.network_interface.start()
 
             command_process.join()
@@ -132,42 +222,86 @@ class Node:
         except KeyboardInterrupt:
             self.stop()
 
+    def _pin_processes(
+        self, command_process: BaseProcess, request_process: BaseProcess
+    ):
+        # keep the latency sensitive request loop away from the cores used for training
+        if self.request_loop_cpu is None or not hasattr(os, "sched_setaffinity"):
+            return
+        other_cpus = os.sched_getaffinity(0) - {self.request_loop_cpu}
+        os.sched_setaffinity(request_process.pid, {self.request_loop_cpu})
+        if other_cpus:
+            os.sched_setaffinity(command_process.pid, other_cpus)
+
     def stop(self):
-        # Terminate and join all processes in the processes list
+        # Signal the loops to exit and stop the network interface
+        self.stop_event.set()
+        self.command_queue.wake()
+        self.network_interface.stop()
+
+        # Give the processes time to exit on their own and only terminate them as a fallback
         for p in self.processes:
-            p.terminate()
-            p.join()
+            p.join(timeout=self.shutdown_timeout)
+            if p.is_alive():
+                p.terminate()
+                p.join()
 
         # Reset the processes list
         self.processes = []
 
+        # Stop executing commands and free the shared memory of the command queue
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.command_queue.close(unlink=True)
+
     async def start_command_queue(self) -> None:
-        while True:
-            try:
-                # Pop the first command from the command queue
-                command_json = self.command_queue.pop(0)
+        loop = asyncio.get_running_loop()
+        while not self.stop_event.is_set():
+            # Wait until the network interface delivers the next command or `stop()` wakes up the loop
+            command_json = await self.command_queue.get_async()
+            if command_json is None:
+                continue
+            batch = [command_json]
+
+            # Take all other commands that are already available, so a burst costs only one event loop turn
+            while len(batch) < self.command_batch_size:
+                try:
+                    batch.append(self.command_queue.get_nowait())
+                except Empty:
+                    break
 
-                # Convert the command from json to a Command object
-                command: Command = Transferables().to_object(command_json, Command)
+            # Execute the commands in the worker thread
+            await loop.run_in_executor(self._executor, self._execute_commands, batch)
 
-                # Check if the command and all subcommands are allowed
-                if self.operation_protection is not None:
-                    # get all commands inside the command tree
-                    command_tree = command.get_command_tree()
+    def _execute_commands(self, batch: list[dict]) -> None:
+        for command_json in batch:
+            # a failing command must not drop the remaining commands of the batch
+            try:
+                self._execute_command(command_json)
+            except Exception:
+                logging.exception("Exception while executing a command")
 
-                    # check if all commands are allowed
-                    for command in command_tree:
-                        if not self.operation_protection.allows(command):
-                            raise ForbiddenOperationError(
-                                f"Command {command.__name__} is not allowed"
-                            )
+    def _execute_command(self, command_json: dict) -> None:
+        # Convert the command from json to a Command object
+        command: Command = _TRANSFERABLES.to_object(command_json, Command)
 
-                # Execute the command on the node
-                command.set_node(self)()
+        # Check if the command and all subcommands are allowed
+        if self.operation_protection is not None:
+            # get the types of all commands inside the command tree. Each type only has to be checked once.
+            command_types = {type(cmd) for cmd in command.get_command_tree().values()}
 
-            # If the command queue is empty, do nothing
-            except IndexError:
-                continue
+            # check if all commands are allowed
+            forbidden = [
+                command_type
+                for command_type in command_types
+                if not self.operation_protection.allows(command_type)
+            ]
+            if forbidden:
+                raise ForbiddenOperationError(
+                    f"Commands {[command_type.__name__ for command_type in forbidden]} are not allowed"
+                )
+
+        # Execute the command on the node
+        command.set_node(self)()
 
     def send_status_update(self, status_update: StatusUpdate) -> requests.Response:
         try:
@@ -2,14 +2,9 @@ from __future__ import annotations
 
 import ssl
 import time
+from collections import deque
 
-from ..common import (
-    ExecutionResponse,
-    ForbiddenOperationError,
-    StatusUpdate,
-    Transferable,
-    Transferables,
-)
+from ..common import ExecutionResponse, ForbiddenOperationError, StatusUpdate
 from ..networking.rabbitmq import ServerToMQInterface
 from ..networking.rest import RestServerInterface
 from ..networking.storage import FileStorage, FileStorageInterface
@@ -21,64 +16,6 @@ from ..watcher import *
 from .client_status import TimeoutClientStatusObserver
 from .topology import Node, NodeStatus, NodeType, Topology
 
-operation_manager_types = list[Instruction | InstructionBundle | Condition] | None
-
-
-# currently not in use
-class OperationManager(Transferable, is_base_type=True):
-    def __init__(
-        self,
-        initial_operations: operation_manager_types = None,
-        opt_in_operations: operation_manager_types = None,
-        running_operations: operation_manager_types = None,
-        constant_conditions: list[Condition] | None = None,
-        operation_protection: OperationWhiteList | OperationBlackList | None = None,
-    ) -> None:
-        """A class that manages the operations of a server.
-
-        Args:
-            initial_operations (list[Instruction | InstructionBundle | Condition], optional): The initial operations to be executed by the server. Defaults to None.
-            opt_in_operations (list[Instruction | InstructionBundle | Condition], optional): The opt-in operations to be executed by the server. Defaults to None.
-            running_operations (list[Instruction | InstructionBundle | Condition], optional): The running operations to be executed by the server. Defaults to None.
-            constant_conditions (list[Condition], optional): The constant conditions to be checked by the server. Defaults to None.
-        """
-
-        self.operation_protection = operation_protection
-
-        # check if all operations are allowed
-        if (
-            self.operation_protection is not None
-            and not self.operation_protection.allows(
-                initial_operations
-                + opt_in_operations
-                + running_operations
-                + constant_conditions
-            )
-        ):
-            raise ForbiddenOperationError(
-                f"OperationManager initialization is not allowed"
-            )
-
-        self.initial_operations = initial_operations
-        self.opt_in_operations = opt_in_operations
-        self.running_operations = running_operations
-        self.constant_conditions = constant_conditions
-
-    def save_as_dict(self) -> dict[str, list[dict[str, any]]]:
-        return {
-            "initial_operations": [op.dict() for op in self.initial_operations],
-            "opt_in_operations": [op.dict() for op in self.opt_in_operations],
-            "running_operations": [op.dict() for op in self.running_operations],
-            "constant_conditions": [cond.dict() for cond in self.constant_conditions],
-        }
-
-    @staticmethod
-    def load_from_dict(data: dict[str, list[dict[str, any]]]) -> OperationManager:
-        return Transferables().to_object(data, OperationManager)
-
-    def process_status_update(self, status_update: StatusUpdate) -> None:
-        ...
-
 
 class Server:
     def __init__(
@@ -118,6 +55,8 @@ class Server:
         self.storage_address = storage_address
         self.storage_port = storage_port
         self.operation_protection = operation_protection
+        # the protection decides by operation type, so the decision is cached per request type
+        self._allowed_requests: dict[type[ServerRequest], bool] = {}
         self.rabbitmq = rabbitmq
 
         # Initialize the storage interface. This will be used to enable communication with the storage.
@@ -142,7 +81,7 @@ class Server:
             .add(ModelSaverWatcher(model_key="model"))
             .add(TheodenConsoleWatcher())
             .add(watcher or [])
-            .notify_all(InitializationNotification(run_name=run_name)),
+            .notify_all(InitializationNotification(run_name=run_name), parallel=True),
         )
 
         # Initialize the topology. This will hold information about the topology of the federated learning system.
@@ -166,8 +105,9 @@ class Server:
         self.history: list[Instruction | InstructionBundle | Condition] = []
 
         # Initialize the operations as an empty list or with the initial instructions. This will hold all the instructions and conditions that are to be executed by the server.
-        self.operations: list[Instruction | InstructionBundle | Condition] = (
-            initial_instructions if initial_instructions else []
+        # A deque is used, as operations are only removed from and inserted at the front.
+        self.operations: deque[Instruction | InstructionBundle | Condition] = deque(
+            initial_instructions or []
         )
 
         # Initialize the communication interface as a RestServerInterface. This will be used to enable communication with the nodes.
@@ -177,7 +117,7 @@ class Server:
                 host=communication_address,
                 port=communication_port or 5672,
                 username=username,
-                password=username,
+                password=password,
                 ssl_context=ssl_context,
                 **kwargs,
             )
@@ -204,18 +144,26 @@ class Server:
         """
 
         # Update the last active time of the node
-        self.topology.get_client_by_name(request.node_name).last_active = time.time()
-
-        if (
-            self.operation_protection is not None
-            and not self.operation_protection.allows(request)
-        ):
-            raise ForbiddenOperationError(
-                f"ServerRequest {type(request).__name__} is not allowed"
-            )
+        self.topology.get_client_by_name(request.node_name).last_active = (
+            time.monotonic()
+        )
+
+        if self.operation_protection is not None:
+            request_type = type(request)
+            allowed = self._allowed_requests.get(request_type)
+            if allowed is None:
+                allowed = self.operation_protection.allows(request_type)
+                self._allowed_requests[request_type] = allowed
+            if not allowed:
+                raise ForbiddenOperationError(
+                    f"ServerRequest {request_type.__name__} is not allowed"
+                )
 
         # Notify all watchers about the request
-        self.resources.watcher.notify_all(ServerRequestNotification(request=request))
+        if request.notify_watchers:
+            self.resources.watcher.notify_all(
+                ServerRequestNotification(request=request), background=True
+            )
 
         # Set the server of the request to this server and execute it
         execution_response = request.set_server(self).execute()
@@ -230,7 +178,7 @@ class Server:
 
         # Update the last active time of the node
         node_name = status_update.node_name
-        self.topology.get_client_by_name(node_name).last_active = time.time()
+        self.topology.get_client_by_name(node_name).last_active = time.monotonic()
 
         # Process the status update with the first operation in the operations list
         self.operations[0].handle_status_update(
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
+import logging
 import time
 from enum import Enum
 from threading import Thread
 from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
-import networkx as nx
 import yaml
 
+from ..common import YAML_LOADER
 from ..resources import ResourceManager
 from ..watcher import TopologyChangeNotification
 from .client_status import ClientStatusObserver
 
 if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
     from ..operations import Distribution
     from ..watcher import WatcherPool
 
@@ -28,7 +30,14 @@ class NodeType(Enum):
     CLIENT = "client"
 
 
+# plain lookup table for the roles in node configs, avoiding an enum call per node
+_ROLE_TO_TYPE = {node_type.value: node_type for node_type in NodeType}
+
+
 class Node:
+    # a topology can hold many clients, so nodes are slotted to keep them small
+    __slots__ = ("name", "type", "flags", "data", "status", "last_active")
+
     def __init__(
         self,
         node_name: str,
@@ -42,7 +51,8 @@ class Node:
         self.flags = flags or []
         self.data = data or {}
         self.status = status
-        self.last_active = time.time()
+        # monotonic, so the timeout of a client is not affected by changes of the system clock
+        self.last_active = time.monotonic()
 
 
 class Topology:
@@ -57,12 +67,29 @@ class Topology:
         self.nodes: dict[str, Node] = (
             Topology.load_from_yaml(yaml_file=node_config) or {}
         )
+        # indices over the server and the clients, kept up to date on every change, so lookups and counts do not scan all nodes
+        self._server: Node | None = None
+        self._clients: dict[str, Node] = {}
+        self._online: dict[str, Node] = {}
+        self._flagged: dict[str, dict[str, Node]] = {}
+        for node in self.nodes.values():
+            self._index_node(node)
         self.lifecycle_pool: set["Distribution"] = set()
         self.watcher = watcher_pool
         self.resource_manager = resource_manager
 
-        observer = Thread(target=observer.observe, args=(self,)) if observer else None
-        observer.start() if observer else None
+        # the last plot and layout of the topology, see `plot_topology()`
+        self._plot: Figure | None = None
+        self._layout: tuple[tuple[frozenset, frozenset], dict] | None = None
+
+        self.observer = observer
+        # the observer runs forever, so it must not keep the process alive
+        observer_thread = (
+            Thread(target=observer.observe, args=(self,), daemon=True)
+            if observer
+            else None
+        )
+        observer_thread.start() if observer_thread else None
 
     @staticmethod
     def load_from_yaml(yaml_file: str | None) -> dict[str, Node] | None:
@@ -71,15 +98,15 @@ class Topology:
 
         print(f"Loading topology from {yaml_file}")
 
-        with open(yaml_file, "r") as f:
-            yaml_data = yaml.safe_load(f)
+        with open(yaml_file, "rb") as f:
+            yaml_data = yaml.load(f, Loader=YAML_LOADER)
 
-        nodes = {}
-        for node in yaml_data:
-            nodes[node["name"]] = Node(
-                node_name=node["name"], node_type=NodeType(node["role"])
+        return {
+            node["name"]: Node(
+                node_name=node["name"], node_type=_ROLE_TO_TYPE[node["role"]]
             )
-        return nodes
+            for node in yaml_data
+        }
 
     def add_lifecycle(self, lifecycle: "Distribution") -> Topology:
         self.lifecycle_pool.add(lifecycle)
@@ -89,19 +116,78 @@ class Topology:
         self.lifecycle_pool.remove(lifecycle)
         return self
 
-    def _inform_about_change(self, node_name: str, include_pool: bool = True):
+    def _inform_about_change(
+        self, node_names: str | list[str], include_pool: bool = True
+    ):
+        if isinstance(node_names, str):
+            node_names = [node_names]
+        self._plot = None
         # update lifecycle pool
         if include_pool:
-            for lifecycle in self.lifecycle_pool.copy():
-                lifecycle.handle_topology_change(
-                    node_name, topology=self, resource_manager=self.resource_manager
-                )
-        self.watcher.notify_all(TopologyChangeNotification(topology=self))
+            for node_name in node_names:
+                for lifecycle in self.lifecycle_pool.copy():
+                    lifecycle.handle_topology_change(
+                        node_name, topology=self, resource_manager=self.resource_manager
+                    )
+        # the notification carries the whole topology, so one is sent per change, not per node. it is delivered from
+        # the background thread while this topology keeps changing, so the watchers get a snapshot
+        self.watcher.notify_all(
+            TopologyChangeNotification(topology=self.snapshot()), background=True
+        )
+
+    def snapshot(self) -> Topology:
+        """Copy the nodes of the topology, so later changes of the topology do not affect the copy.
+
+        Returns:
+            Topology: The copy, without the observer and the lifecycles of this topology.
+        """
+        snapshot = Topology(
+            watcher_pool=self.watcher, resource_manager=self.resource_manager
+        )
+        for node in self.nodes.values():
+            copy = Node(
+                node_name=node.name,
+                node_type=node.type,
+                flags=list(node.flags),
+                data=dict(node.data),
+                status=node.status,
+            )
+            copy.last_active = node.last_active
+            snapshot.nodes[copy.name] = copy
+            snapshot._index_node(copy)
+        return snapshot
+
+    def _index_node(self, node: Node) -> None:
+        if node.type is NodeType.SERVER and self._server is None:
+            self._server = node
+        if node.type is not NodeType.CLIENT:
+            return
+        self._clients[node.name] = node
+        if node.status is NodeStatus.ONLINE:
+            self._online[node.name] = node
+        for flag in node.flags:
+            self._flagged.setdefault(flag, {})[node.name] = node
+
+    def _unindex_node(self, node: Node) -> None:
+        if node is self._server:
+            self._server = next(
+                (n for n in self.nodes.values() if n.type is NodeType.SERVER), None
+            )
+        self._clients.pop(node.name, None)
+        self._online.pop(node.name, None)
+        for flag in node.flags:
+            self._flagged.get(flag, {}).pop(node.name, None)
 
     def add_node(self, node: Node) -> Topology:
         if node.name in self.nodes:
             raise ValueError(f"Node with name {node.name} already exists")
         self.nodes[node.name] = node
+        self._index_node(node)
+
+        # a client can be added as online (e.g. on its first message), so it has to be watched like in `set_online()`
+        if self.observer is not None and node.name in self._online:
+            self.observer.watch(node)
+
         self._inform_about_change(node.name)
         return self
 
@@ -109,60 +195,58 @@ class Topology:
         if node_name not in self.nodes:
             return
 
-        del self.nodes[node_name]
+        self._unindex_node(self.nodes.pop(node_name))
         self._inform_about_change(node_name)
 
     @property
     def server(self) -> Node:
-        for node in self.nodes.values():
-            if node.type == NodeType.SERVER:
-                return node
-        raise ValueError("No server node found")
+        if self._server is None:
+            raise ValueError("No server node found")
+        return self._server
 
     @property
     def clients(self) -> list[Node]:
-        return [node for node in self.nodes.values() if node.type == NodeType.CLIENT]
+        return list(self._clients.values())
 
     @property
     def client_names(self) -> list[str]:
-        return [node.name for node in self.clients]
+        return list(self._clients)
 
     @property
     def num_clients(self) -> int:
-        return len(self.clients)
+        return len(self._clients)
 
     @property
     def num_connected_clients(self) -> int:
-        return len([node for node in self.clients if node.status == NodeStatus.ONLINE])
+        return len(self._online)
 
     @property
     def num_offline_clients(self) -> int:
-        return len([node for node in self.clients if node.status == NodeStatus.OFFLINE])
+        return len(self._clients) - len(self._online)
 
     @property
     def fraction_connected_clients(self) -> float:
         return self.num_connected_clients / self.num_clients
 
     def online_clients(self, names: bool = False) -> list[Node] | list[str]:
-        return [
-            (node.name if names else node)
-            for node in self.clients
-            if node.status == NodeStatus.ONLINE
-        ]
+        return list(self._online) if names else list(self._online.values())
 
     def get_client_by_name(self, node_name: str) -> Node:
-        for node in self.clients:
-            if node.name == node_name:
-                return node
-        raise KeyError(f"Client with name {node_name} not found")
+        try:
+            return self._clients[node_name]
+        except KeyError:
+            raise KeyError(f"Client with name {node_name} not found")
 
     def get_clients_with_flag(self, flag: str) -> list[Node]:
-        return [node for node in self.clients if flag in node.flags]
+        return list(self._flagged.get(flag, {}).values())
 
     def get_clients_without_flag(self, flag: str) -> list[Node]:
-        return [node for node in self.clients if flag not in node.flags]
+        flagged = self._flagged.get(flag, {})
+        return [node for node in self.clients if node.name not in flagged]
 
     def get_clients_with_status(self, status: NodeStatus) -> list[Node]:
+        if status is NodeStatus.ONLINE:
+            return list(self._online.values())
         return [node for node in self.clients if node.status == status]
 
     def flags_of_clients(self) -> dict[str, list[str]]:
@@ -176,8 +260,12 @@ class Topology:
     def set_online(self, node_name: str | Node) -> None:
         if isinstance(node_name, str):
             node_name = self.get_client_by_name(node_name)
-        node_name.last_active = time.time()
+        node_name.last_active = time.monotonic()
         node_name.status = NodeStatus.ONLINE
+        self._online[node_name.name] = node_name
+
+        if self.observer is not None:
+            self.observer.watch(node_name)
 
         self._inform_about_change(node_name.name)
 
@@ -185,24 +273,34 @@ class Topology:
         if isinstance(node_name, str):
             node_name = self.get_client_by_name(node_name)
         node_name.status = NodeStatus.OFFLINE
+        self._online.pop(node_name.name, None)
 
-        print(f"Node {node_name.name} is offline")
+        logging.warning("Node %s is offline", node_name.name)
 
         self._inform_about_change(node_name.name)
 
     def set_flag_of_nodes(self, nodes: list[Node] | list[str], flag: str) -> None:
+        changed = []
         for node in nodes:
             _node = node if isinstance(node, Node) else self.get_client_by_name(node)
             if flag not in _node.flags:
                 _node.flags.append(flag)
-            self._inform_about_change(_node.name, include_pool=False)
+                if _node.type is NodeType.CLIENT:
+                    self._flagged.setdefault(flag, {})[_node.name] = _node
+                changed.append(_node.name)
+        if changed:
+            self._inform_about_change(changed, include_pool=False)
 
     def remove_flag_of_nodes(self, nodes: list[Node] | list[str], flag: str) -> None:
+        changed = []
         for node in nodes:
             _node = node if isinstance(node, Node) else self.get_client_by_name(node)
-            if flag not in _node.flags:
+            if flag in _node.flags:
                 _node.flags.remove(flag)
-            self._inform_about_change(_node.name, include_pool=False)
+                self._flagged.get(flag, {}).pop(_node.name, None)
+                changed.append(_node.name)
+        if changed:
+            self._inform_about_change(changed, include_pool=False)
 
     @staticmethod
     def get_nodes_with_flag(nodes: list[Node], flag: str) -> list[Node]:
@@ -212,66 +310,74 @@ class Topology:
     def get_data_of_nodes(nodes: list[Node], data_key: str) -> list[any]:
         return [node.data[data_key] for node in nodes]
 
-    def plot_topology(self) -> plt.Figure:
-        G = nx.Graph()
+    def plot_topology(self) -> Figure:
+        # the plot only changes with the topology, so it is reused until the next change
+        if self._plot is not None:
+            return self._plot
 
-        # Add server node
-        server_node = self.server
-        G.add_node(
-            server_node.name,
-            label=server_node.name,
-            type=server_node.type.name,
-            status=server_node.status.name,
-            flags="",
-        )
+        # plotting is rarely needed, so networkx and matplotlib are only imported here
+        import networkx as nx
+        from matplotlib.figure import Figure
 
-        # Add client nodes and edges
-        online_clients = []
-        offline_clients = []
-
-        for client in self.clients:
-            G.add_node(
-                client.name,
-                label=client.name,
-                type=client.type.name,
-                status=client.status.name,
-                flags=", ".join(client.flags),
+        # Collect the nodes, labels, colors and edges in a single pass over the clients
+        server_node = self.server
+        nodes = []
+        labels = {}
+        node_colors = []
+        edges = []
+
+        for node in [server_node, *self.clients]:
+            flags = ", ".join(node.flags) if node is not server_node else ""
+            nodes.append(
+                (
+                    node.name,
+                    {
+                        "label": node.name,
+                        "type": node.type.name,
+                        "status": node.status.name,
+                        "flags": flags,
+                    },
+                )
+            )
+            labels[node.name] = (
+                f"{node.name}\nType: {node.type.name}\nStatus: {node.status.name}\nFlags: {flags}"
             )
-            if client.status == NodeStatus.ONLINE:
-                G.add_edge(server_node.name, client.name)
-                online_clients.append(client.name)
-            else:
-                offline_clients.append(client.name)
-
-        # Create a mapping of node labels
-        labels = {
-            node: f"{node}\nType: {G.nodes[node]['type']}\nStatus: {G.nodes[node]['status']}\nFlags: {G.nodes[node]['flags']}"
-            for node in G.nodes
-        }
 
-        # Use Kamada-Kawai layout for improved positioning with scale adjustment
-        pos = nx.kamada_kawai_layout(G, scale=0.2)  # Adjust the scale for less padding
+            if node is server_node:
+                node_colors.append("red")
+            elif node.status is NodeStatus.ONLINE:
+                node_colors.append("green")
+                edges.append((server_node.name, node.name))
+            else:
+                node_colors.append("gray")
 
-        # Increase figure size
-        plt.figure(figsize=(7, 5))  # Increase the figure size to accommodate more nodes
+        G = nx.Graph()
+        G.add_nodes_from(nodes)
+        G.add_edges_from(edges)
+
+        # Use Kamada-Kawai layout for improved positioning with scale adjustment.
+        # The layout is expensive, so it is only recomputed if the nodes or edges changed.
+        layout_key = (frozenset(G.nodes), frozenset(G.edges))
+        if self._layout is None or self._layout[0] != layout_key:
+            # Adjust the scale for less padding
+            pos = nx.kamada_kawai_layout(G, scale=0.2)
+            self._layout = (layout_key, pos)
+        pos = self._layout[1]
+
+        # The figure is created without pyplot, so no GUI backend is initialized and no global state is touched.
+        # Increase the figure size to accommodate more nodes
+        figure = Figure(figsize=(7, 5))
+        ax = figure.subplots()
         pad = 0.3
-        plt.xlim(-pad, pad)  # Adjust the x-axis limits to add less padding
-        plt.ylim(-pad, pad)  # Adjust the y-axis limits to add less padding
+        ax.set_xlim(-pad, pad)  # Adjust the x-axis limits to add less padding
+        ax.set_ylim(-pad, pad)  # Adjust the y-axis limits to add less padding
 
         # Draw the graph with customized labels and node colors
-        node_colors = [
-            "red"
-            if node == server_node.name
-            else "green"
-            if G.nodes[node]["status"] == "ONLINE"
-            else "gray"
-            for node in G.nodes
-        ]
-        nx.draw(G, pos, with_labels=False, node_color=node_colors, node_size=250)
+        nx.draw(G, pos, ax=ax, with_labels=False, node_color=node_colors, node_size=250)
 
         # Customize label appearance
         node_labels = nx.draw_networkx_labels(
-            G, pos, labels, font_size=8, verticalalignment="bottom"
+            G, pos, labels, ax=ax, font_size=8, verticalalignment="bottom"
         )
 
         # Add a box behind labels
@@ -286,18 +392,6 @@ class Topology:
             )
 
         # Draw edges between the server and online clients with a different color
-        edge_colors = [
-            "yellow"
-            if edge[0] == server_node.name and edge[1] in online_clients
-            else "gray"
-            for edge in G.edges()
-        ]
-        nx.draw_networkx_edges(
-            G,
-            pos,
-            edgelist=[edge for edge in G.edges() if edge[0] == server_node.name],
-            edge_color=edge_colors,
-        )
-        figure = plt.gcf()
-        plt.close(figure)
+        nx.draw_networkx_edges(G, pos, ax=ax, edgelist=edges, edge_color="yellow")
+        self._plot = figure
         return figure
@@ -22,6 +22,13 @@ class NewBestDetectorWatcher(MetricCollectionWatcher, Transferable):
         super().__init__()
 
     def _process_metrics(self, metric: MetricNotification) -> None:
+        # filter by type first, so metrics of the other type never trigger resolving the loss
+        if metric.is_aggregate and self.metric_type == "single":
+            return
+
+        if not metric.is_aggregate and self.metric_type == "aggregate":
+            return
+
         if self.metric is None:
             losses = self.pool.base_topology.resources.gr(
                 "losses", assert_type=list[Loss]
@@ -30,28 +37,19 @@ class NewBestDetectorWatcher(MetricCollectionWatcher, Transferable):
             self.metric = choosing.display_name()
             self.lower_is_better = not choosing.higher_better
 
-        if metric.is_aggregate and self.metric_type == "single":
+        score = metric.metrics.get(self.metric)
+        if score is None:
             return
 
-        if not metric.is_aggregate and self.metric_type == "aggregate":
-            return
-
-        if self.metric not in metric.metrics:
-            return
-
-        is_new_best = False
-
-        if metric.metric_type not in self.best_score:
-            is_new_best = True
-        elif self.lower_is_better:
-            if metric.metrics[self.metric] < self.best_score[metric.metric_type]:
-                is_new_best = True
-        else:
-            if metric.metrics[self.metric] > self.best_score[metric.metric_type]:
-                is_new_best = True
+        best_score = self.best_score.get(metric.metric_type)
+        is_new_best = (
+            best_score is None
+            or (self.lower_is_better and score < best_score)
+            or (not self.lower_is_better and score > best_score)
+        )
 
         if is_new_best:
-            self.best_score[metric.metric_type] = metric.metrics[self.metric]
+            self.best_score[metric.metric_type] = score
             self.pool.notify_all(
                 notification=NewBestModelNotification(
                     metric=self.metric,
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import threading
 import time
-from queue import SimpleQueue
+from dataclasses import dataclass
 
-from fastapi import FastAPI, WebSocket
-from fastapi.websockets import WebSocketState
-from pydantic import BaseModel
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from uvicorn import Config, Server
 from websockets.exceptions import ConnectionClosedOK
 
@@ -24,13 +23,35 @@ app = FastAPI()
 # Keep track of connected WebSocket clients
 connected_clients = set()
 
-# Queue for communication between threads
-message_queue = SimpleQueue()
+# Queue for communication between threads. Created in the event loop of the server, see `run_server()`.
+message_queue: asyncio.Queue | None = None
+_loop: asyncio.AbstractEventLoop | None = None
 
 
 async def send_message_to_clients(message):
-    for client in connected_clients:
-        await client.send_json(message)
+    # encode the message once for all clients, with the same encoding as `WebSocket.send_json()`
+    data = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+    # send to all clients concurrently and drop the clients whose connection failed
+    clients = list(connected_clients)
+    results = await asyncio.gather(
+        *(client.send_text(data) for client in clients), return_exceptions=True
+    )
+    for client, result in zip(clients, results):
+        if isinstance(result, Exception):
+            connected_clients.discard(client)
+
+
+async def broadcast_messages():
+    while True:
+        # wait for the next message and take all messages that arrived in the meantime
+        messages = [await message_queue.get()]
+        while not message_queue.empty():
+            messages.append(message_queue.get_nowait())
+
+        # every message type carries the full state, so only the latest message of each type is sent
+        latest = {message["type"]: message for message in messages}
+        for message in latest.values():
+            await send_message_to_clients(message)
 
 
 @app.websocket("/ws")
@@ -39,27 +60,28 @@ async def websocket_endpoint(websocket: WebSocket):
     connected_clients.add(websocket)
 
     try:
-        while websocket.application_state != WebSocketState.DISCONNECTED:
-            # Send a message to all connected clients
-            while not message_queue.empty():
-                message = message_queue.get()
-                await send_message_to_clients(message)
-
-            # Sleep for a short duration to avoid high CPU usage
-            await asyncio.sleep(0.2)
+        # messages are sent by `broadcast_messages()`, so this only waits until the client disconnects
+        while True:
+            await websocket.receive_text()
 
     except asyncio.CancelledError:
         pass
-    except ConnectionClosedOK:
+    except (ConnectionClosedOK, WebSocketDisconnect):
         pass
     finally:
-        connected_clients.remove(websocket)
+        connected_clients.discard(websocket)
 
 
 async def run_server():
+    global message_queue, _loop
+    message_queue = asyncio.Queue()
+    _loop = asyncio.get_running_loop()
+    broadcaster = asyncio.create_task(broadcast_messages())
+
     config = Config(app, host="localhost", port=3791, loop="asyncio")
     server = Server(config)
     await server.serve()
+    broadcaster.cancel()
 
 
 def start_server_in_thread():
@@ -69,9 +91,10 @@ def start_server_in_thread():
 
 
 def send_message_to_websocket(message):
-    if len(connected_clients) == 0:
+    if len(connected_clients) == 0 or _loop is None:
         return
-    message_queue.put(message)
+    # the watchers run in other threads, so the message is handed to the event loop of the server
+    _loop.call_soon_threadsafe(message_queue.put_nowait, message)
 
 
 async def main():
@@ -80,7 +103,8 @@ async def main():
     thread.start()
 
 
-class StatusRow(BaseModel):
+@dataclass(slots=True)
+class StatusRow:
     node_name: str
     uuid: str
     type: str
@@ -88,6 +112,21 @@ class StatusRow(BaseModel):
     expanded: bool = True
     subcommands: list[StatusRow] | None = None
 
+    def dict(self) -> dict:
+        # built by hand, as the rows are serialized for every status update
+        return {
+            "node_name": self.node_name,
+            "uuid": self.uuid,
+            "type": self.type,
+            "status": self.status,
+            "expanded": self.expanded,
+            "subcommands": (
+                [subcommand.dict() for subcommand in self.subcommands]
+                if self.subcommands is not None
+                else None
+            ),
+        }
+
 
 class TheodenConsoleWatcher(MetricCollectionWatcher, Transferable):
     """Watcher to collect metrics from the framework and save them to Aim"""
@@ -1,3 +1,5 @@
+import statistics
+from collections import defaultdict
 from itertools import chain
 
 from ..common import Transferable
@@ -6,11 +8,18 @@ from .notifications import CommandFinishedNotification, MetricNotification
 
 
 class MetricAggregationWatcher(MetricCollectionWatcher, Transferable):
+    # the functions to aggregate the values of a metric with
+    aggregation_functions = {"mean": statistics.fmean, "median": statistics.median}
+
     def __init__(
         self, aggregation_method: str = "mean", clear_after_aggregation: bool = True
     ) -> None:
         super().__init__({CommandFinishedNotification: self._handle_command_finished})
+        if aggregation_method not in self.aggregation_functions:
+            raise ValueError(f"Unknown aggregation method {aggregation_method}")
         self.aggregation_method = aggregation_method
+        # resolve the aggregation function once instead of for every group of metrics
+        self._aggregate = self.aggregation_functions[aggregation_method]
         self.clear_after_aggregation = clear_after_aggregation
         self._metrics: dict[str, list[MetricNotification]] = {}
 
@@ -23,60 +32,43 @@ class MetricAggregationWatcher(MetricCollectionWatcher, Transferable):
         # get the metrics
         metrics = self._metrics[notification.command_uuid]
 
-        # loop over different comm rounds
-        for comm_round in set(m.comm_round for m in metrics):
-            # loop over different epochs
-            for epoch in set(m.epoch for m in metrics):
-                # loop over different metric types
-                for metric_type in set(m.metric_type for m in metrics):
-                    # get all the relevant metrics based on the comm round, epoch and metric type
-                    relevant_metrics = [
-                        m
-                        for m in metrics
-                        if m.comm_round == comm_round
-                        and m.epoch == epoch
-                        and m.metric_type == metric_type
-                    ]
-
-                    # check if there are any metrics
-                    if len(relevant_metrics) == 0:
-                        continue
+        # group the metrics by comm round, epoch and metric type in a single pass
+        groups: dict[tuple, list[MetricNotification]] = defaultdict(list)
+        for m in metrics:
+            groups[(m.comm_round, m.epoch, m.metric_type)].append(m)
 
-                    # get all the metric names
-                    metric_names = set(
-                        chain.from_iterable(
-                            list(m.metrics.keys()) for m in relevant_metrics
-                        )
-                    )
+        for (comm_round, epoch, metric_type), relevant_metrics in groups.items():
+            # get all the metric names
+            metric_names = set(
+                chain.from_iterable(m.metrics.keys() for m in relevant_metrics)
+            )
 
-                    # aggregate the metrics
-                    if self.aggregation_method == "mean":
-                        aggregated_metric = {
-                            metric_name: sum(
-                                m.metrics[metric_name] for m in relevant_metrics
-                            )
-                            / len(relevant_metrics)
-                            for metric_name in metric_names
-                        }
-                    elif self.aggregation_method == "median":
-                        raise NotImplementedError(
-                            "Median aggregation is not implemented yet"
-                        )
+            # aggregate the metrics. A metric that is missing for some nodes is not aggregated.
+            aggregated_metric = {}
+            for metric_name in metric_names:
+                values = []
+                for m in relevant_metrics:
+                    value = m.metrics.get(metric_name)
+                    if value is None:
+                        break
+                    values.append(value)
+                else:
+                    aggregated_metric[metric_name] = self._aggregate(values)
 
-                    # notify the pool of the aggregated metric
-                    self.pool.notify_of_type(
-                        notification=MetricNotification(
-                            metrics=aggregated_metric,
-                            comm_round=comm_round,
-                            epoch=epoch,
-                            metric_type=metric_type,
-                            node_name=self.aggregation_method,
-                            is_aggregate=True,
-                            command_uuid=notification.command_uuid,
-                        ),
-                        of_type=MetricCollectionWatcher,
-                        origin=self,
-                    )
+            # notify the pool of the aggregated metric
+            self.pool.notify_of_type(
+                notification=MetricNotification(
+                    metrics=aggregated_metric,
+                    comm_round=comm_round,
+                    epoch=epoch,
+                    metric_type=metric_type,
+                    node_name=self.aggregation_method,
+                    is_aggregate=True,
+                    command_uuid=notification.command_uuid,
+                ),
+                of_type=MetricCollectionWatcher,
+                origin=self,
+            )
         # remove the metric
         del self._metrics[notification.command_uuid]
 
@@ -21,12 +21,10 @@ class MetricCollectionWatcher(Watcher, Transferable):
                 MetricNotification: self._handle_metric,
             }
         else:
-            if StatusUpdateNotification not in notification_of_interest:
-                notification_of_interest[
-                    StatusUpdateNotification
-                ] = self._handle_status_update
-            if MetricNotification not in notification_of_interest:
-                notification_of_interest[MetricNotification] = self._handle_metric
+            notification_of_interest.setdefault(
+                StatusUpdateNotification, self._handle_status_update
+            )
+            notification_of_interest.setdefault(MetricNotification, self._handle_metric)
 
         super().__init__(notification_of_interest, self._process_other_notification)
 
@@ -46,16 +44,16 @@ class MetricCollectionWatcher(Watcher, Transferable):
         # Get the status update
         status_update = notification.status_update
         # Check if the status update is a metric response
-        if status_update.response and status_update.response.response_type == "metric":
+        response = status_update.response
+        if response and response.response_type == "metric":
+            data = response.get_data()
             # Save the metrics
             self._process_metrics(
                 MetricNotification(
-                    metrics=status_update.response.get_data()["metrics"],
-                    comm_round=status_update.response.get_data().get(
-                        "comm_round", None
-                    ),
-                    epoch=status_update.response.get_data().get("epoch", None),
-                    metric_type=status_update.response.get_data()["metric_type"],
+                    metrics=data["metrics"],
+                    comm_round=data.get("comm_round"),
+                    epoch=data.get("epoch"),
+                    metric_type=data["metric_type"],
                     node_name=status_update.node_name,
                     command_uuid=status_update.command_uuid,
                 )
@@ -1,10 +1,50 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from ..common import GlobalContext, Transferable
+from ..common import BackgroundWorker, GlobalContext, Transferable
 from ..resources import Loss
 from .notifications import InitializationNotification, NewBestModelNotification
 from .watcher import Watcher
 
+if TYPE_CHECKING:
+    from ..resources.meta.checkpoints import Checkpoint
+
+
+def _save(item: tuple["Checkpoint", Path]) -> None:
+    checkpoint, path = item
+    # write to a temporary file first, so a crash never leaves a partially written checkpoint at the path
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        checkpoint.save(path=tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logging.warning("Exception while saving checkpoint to %s: %s", path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+# writes the checkpoints, a newer checkpoint for a path replaces an unwritten older one
+_writer = BackgroundWorker(_save)
+
+
+def _save_in_background(checkpoint: "Checkpoint", path: Path) -> None:
+    """Save a checkpoint to a file from the writer thread
+
+    Args:
+        checkpoint (Checkpoint): The checkpoint to save. It must not be changed afterwards.
+        path (Path): The path of the file
+    """
+    _writer.submit((checkpoint, path), key=path)
+
+
+@atexit.register
+def _wait_for_pending_saves() -> None:
+    _writer.flush()
+
 
 class ModelSaverWatcher(Watcher, Transferable):
     def __init__(
@@ -27,11 +67,23 @@ class ModelSaverWatcher(Watcher, Transferable):
         )
         self.model_key = model_key
         self.run_name = ""
+        # the folder of the run, created on the first save
+        self._save_dir: Path | None = None
 
     def _set_run_name(
         self, notification: InitializationNotification, origin: Watcher | None = None
     ) -> None:
         self.run_name = notification.run_name
+        self._save_dir = None
+
+    def _get_save_dir(self) -> Path:
+        if self._save_dir is None:
+            save_dir = Path(self.save_folder)
+            if self.run_name:
+                save_dir = save_dir / self.run_name
+            save_dir.mkdir(parents=True, exist_ok=True)
+            self._save_dir = save_dir
+        return self._save_dir
 
     def _handle(
         self, notification: NewBestModelNotification, origin: Watcher | None = None
@@ -45,24 +97,20 @@ class ModelSaverWatcher(Watcher, Transferable):
         if notification.metric == self.listen_to:
             cm = self.base_topology.resources.checkpoint_manager
 
-            path = (
-                Path(self.save_folder)
-                / self.run_name
-                / f"{self.model_key}_best_{notification.split}.pt"
-                if self.run_name
-                else Path(self.save_folder)
-                / f"{self.model_key}_best_{notification.split}.pt"
-            )
+            checkpoint_key = f"{self.model_key}_best_{notification.split}"
+            path = self._get_save_dir() / f"{checkpoint_key}.pt"
 
             print(
-                f"Saving new best {notification.split} model '{self.model_key}' as '{self.model_key}_best_{notification.split}' to '{path.as_posix()}'"
+                f"Saving new best {notification.split} model '{self.model_key}' as '{checkpoint_key}' to '{path.as_posix()}'"
             )
 
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-            cm.copy_checkpoint(
-                resource_type="model",
-                resource_key=self.model_key,
-                checkpoint_key="__global__",
-                new_checkpoint_key=f"{self.model_key}_best_{notification.split}",
-            ).save(path=path)
+            # the copy is a snapshot of the global model, so it can be written while training continues
+            _save_in_background(
+                cm.copy_checkpoint(
+                    resource_type="model",
+                    resource_key=self.model_key,
+                    checkpoint_key="__global__",
+                    new_checkpoint_key=checkpoint_key,
+                ),
+                path,
+            )
@@ -8,38 +8,42 @@ if TYPE_CHECKING:
 
 
 class WatcherNotification:
-    """Base class for all notifications."""
+    """Base class for all notifications.
 
-    pass
+    Notifications are created for every server request and topology change, so they are slotted to keep them small
+    and cheap to create.
+    """
 
+    __slots__ = ()
 
-@dataclass
+
+@dataclass(slots=True)
 class InitializationNotification(WatcherNotification):
     run_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusUpdateNotification(WatcherNotification):
     """Notification for a status update."""
 
     status_update: "StatusUpdate"
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerRequestNotification(WatcherNotification):
     """Notification for a server request."""
 
     request: "ServerRequest"
 
 
-@dataclass
+@dataclass(slots=True)
 class TopologyChangeNotification(WatcherNotification):
-    """Notification for a server request."""
+    """Notification for a change of the topology, with a snapshot of the topology after the change."""
 
     topology: "Topology"
 
 
-@dataclass
+@dataclass(slots=True)
 class NewBestModelNotification(WatcherNotification):
     """Notification for a new best model."""
 
@@ -48,14 +52,14 @@ class NewBestModelNotification(WatcherNotification):
     comm_round: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregationCompletedNotification(WatcherNotification):
     """Notification that aggregation has completed."""
 
     comm_round: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterNotification(WatcherNotification):
     """Notification for a new best model."""
 
@@ -63,14 +67,14 @@ class ParameterNotification(WatcherNotification):
     comm_round: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandFinishedNotification(WatcherNotification):
     """Notification for a new best model."""
 
     command_uuid: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricNotification(WatcherNotification):
     """Notification for a new best model."""
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-from .notifications import WatcherNotification
+from ..common import BackgroundWorker
+from .notifications import TopologyChangeNotification, WatcherNotification
 from .watcher import Watcher
 
 if TYPE_CHECKING:
@@ -19,9 +21,18 @@ class WatcherPool:
             base_topology (Server | Node): The base topology of the watcher pool
         """
 
-        self.watchers: set[Watcher] = set()
+        # watchers by id, a dict keeps them in the order they were added so they are notified in a fixed order
+        self.watchers: dict[int, Watcher] = {}
         self.base_topology = base_topology
 
+        # watchers interested in each notification type, built on the first notification of a type
+        self._interested: dict[type[WatcherNotification], list[Watcher]] = {}
+
+        # dispatches notifications from a background thread, see `notify_all(..., background=True)`
+        self._background = BackgroundWorker(
+            lambda item: self.notify_all(*item), supersedes=_same_topology_change
+        )
+
     def add(self, watcher: Watcher | list[Watcher]) -> WatcherPool:
         """Add a watcher/multiple watcher to the pool and set the pool of the watcher(s) to this pool
 
@@ -33,9 +44,10 @@ class WatcherPool:
         """
         if isinstance(watcher, list):
             for w in watcher:
-                self.watchers.add(w.set_pool(self))
+                self.watchers[id(w)] = w.set_pool(self)
         else:
-            self.watchers.add(watcher.set_pool(self))
+            self.watchers[id(watcher)] = watcher.set_pool(self)
+        self._interested = {}
         return self
 
     def remove(self, watcher: Watcher) -> WatcherPool:
@@ -44,27 +56,72 @@ class WatcherPool:
         Args:
             watcher (Watcher): The watcher to remove
         """
-        self.watchers.remove(watcher)
+        self.watchers.pop(id(watcher), None)
+        self._interested = {}
         return self
 
+    def interests_changed(self) -> None:
+        """Called by a watcher of the pool when the notifications it handles have changed."""
+        self._interested = {}
+
+    def _watchers_for(
+        self, notification_type: type[WatcherNotification]
+    ) -> list[Watcher]:
+        watchers = self._interested.get(notification_type)
+        if watchers is None:
+            watchers = [
+                watcher
+                for watcher in self.watchers.values()
+                if watcher.is_interested_in(notification_type)
+            ]
+            self._interested[notification_type] = watchers
+        return watchers
+
+    def _notify(
+        self,
+        watcher: Watcher,
+        notification: WatcherNotification,
+        origin: Watcher | None = None,
+    ) -> None:
+        try:
+            watcher.listen(notification, origin=origin)
+        except Exception as e:
+            logging.warning(
+                "Exception while notifying watcher %s: %s", type(watcher).__name__, e
+            )
+
     def notify_all(
-        self, notification: WatcherNotification, origin: Watcher | None = None
+        self,
+        notification: WatcherNotification,
+        origin: Watcher | None = None,
+        parallel: bool = False,
+        background: bool = False,
     ) -> WatcherPool:
-        """Notify all watchers in the pool
+        """Notify all watchers in the pool that are interested in the type of the notification
 
         Args:
             notification (WatcherNotification): The notification to send
+            parallel (bool, optional): Whether to notify the watchers in parallel threads. Should only be used for notifications whose handlers do not depend on each other, e.g. blocking initializations. Defaults to False.
+            background (bool, optional): Whether to return immediately and notify the watchers from a background thread. Should be used for notifications sent while handling requests. Background notifications are delivered in the order they were sent, but not in order with notifications sent without `background`, which may arrive first. They must therefore not reference state that changes afterwards, e.g. the topology is sent as a snapshot. Defaults to False.
 
         Returns:
             WatcherPool: The watcher pool
         """
-        for watcher in self.watchers:
-            try:
-                watcher.listen(notification, origin=origin)
-            except Exception as e:
-                logging.warning(
-                    f"Exception while notifying watcher {type(watcher).__name__}: {e}"
-                )
+        watchers = self._watchers_for(type(notification))
+
+        if background:
+            if watchers:
+                self._background.submit((notification, origin))
+            return self
+
+        if parallel and len(watchers) > 1:
+            with ThreadPoolExecutor(max_workers=len(watchers)) as executor:
+                for watcher in watchers:
+                    executor.submit(self._notify, watcher, notification, origin)
+            return self
+
+        for watcher in watchers:
+            self._notify(watcher, notification, origin)
         return self
 
     def notify_of_type(
@@ -82,12 +139,21 @@ class WatcherPool:
         Returns:
             WatcherPool: The watcher pool
         """
-        for watcher in self.watchers:
+        for watcher in self.watchers.values():
             if isinstance(watcher, of_type):
-                try:
-                    watcher.listen(notification, origin=origin)
-                except Exception as e:
-                    logging.warning(
-                        f"Exception while notifying watcher {type(watcher).__name__}: {e}"
-                    )
+                self._notify(watcher, notification, origin)
         return self
+
+
+def _same_topology_change(
+    item: tuple[WatcherNotification, Watcher | None],
+    next_item: tuple[WatcherNotification, Watcher | None],
+) -> bool:
+    # a topology change notification carries a snapshot of the whole topology, so only the last of a row is needed
+    notification, origin = item
+    next_notification, next_origin = next_item
+    return (
+        isinstance(notification, TopologyChangeNotification)
+        and isinstance(next_notification, TopologyChangeNotification)
+        and next_origin is origin
+    )
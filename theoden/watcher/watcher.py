@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
 
 from ..common import Transferable
 from .notifications import WatcherNotification
@@ -33,6 +34,65 @@ class Watcher(Transferable, is_base_type=True):
         self.notification_of_interest = notification_of_interest or {}
         self.fallback_handler = fallback_handler
 
+    @property
+    def notification_of_interest(
+        self,
+    ) -> Mapping[type[WatcherNotification], callable]:
+        """The handlers of the watcher by notification type. Read-only, assign a new dict to change them."""
+        return self._notification_of_interest
+
+    @notification_of_interest.setter
+    def notification_of_interest(
+        self, notification_of_interest: dict[type[WatcherNotification], callable]
+    ) -> None:
+        # a read-only copy, as changing the handlers in place would not reset the cached handlers
+        self._notification_of_interest = MappingProxyType(
+            dict(notification_of_interest)
+        )
+        self._interests_changed()
+
+    @property
+    def fallback_handler(self) -> callable | None:
+        """The handler of notifications without a handler in `notification_of_interest`"""
+        return self._fallback_handler
+
+    @fallback_handler.setter
+    def fallback_handler(self, fallback_handler: callable | None) -> None:
+        self._fallback_handler = fallback_handler
+        self._interests_changed()
+
+    def _interests_changed(self) -> None:
+        self._handlers: dict[type[WatcherNotification], callable | None] = {}
+        # the pool caches which watchers handle which notifications
+        pool = getattr(self, "pool", None)
+        if pool is not None:
+            pool.interests_changed()
+
+    def _resolve(self, notification_type: type[WatcherNotification]) -> callable | None:
+        """Get the handler of a notification type
+
+        The handler of the closest class in the method resolution order of the type is used, the fallback handler if
+        there is none. The result is cached per type and reset when `notification_of_interest` or `fallback_handler` is
+        assigned.
+
+        Args:
+            notification_type (type[WatcherNotification]): The type of the notification
+
+        Returns:
+            callable | None: The handler or None if the watcher does not handle the type
+        """
+        try:
+            return self._handlers[notification_type]
+        except KeyError:
+            pass
+        handler = self._fallback_handler
+        for cls in notification_type.__mro__:
+            if cls in self._notification_of_interest:
+                handler = self._notification_of_interest[cls]
+                break
+        self._handlers[notification_type] = handler
+        return handler
+
     def set_pool(self, pool: "WatcherPool") -> Watcher:
         """Set the pool of nodes
 
@@ -54,18 +114,32 @@ class Watcher(Transferable, is_base_type=True):
         """
         return self.pool.base_topology
 
+    def is_interested_in(self, notification_type: type[WatcherNotification]) -> bool:
+        """Check if the watcher handles notifications of a type
+
+        Args:
+            notification_type (type[WatcherNotification]): The type of the notification
+
+        Returns:
+            bool: True if the watcher has a handler or a fallback handler for the type, False otherwise
+        """
+        return self._fallback_handler is not None or any(
+            issubclass(notification_type, interest)
+            for interest in self.notification_of_interest
+        )
+
     def listen(
         self, notification: WatcherNotification, origin: Watcher | None = None
     ) -> None:
         """Function to listen to the pool of nodes
 
+        Only one handler is called per notification: the handler registered for the closest class of the notification
+        or the fallback handler if no class of the notification is registered.
+
         Args:
             notification (WatcherNotification): The notification
             origin (Watcher): The origin of the notification
         """
-        for notification_type, handler in self.notification_of_interest.items():
-            if isinstance(notification, notification_type):
-                handler(notification, origin)
-            else:
-                if self.fallback_handler is not None:
-                    self.fallback_handler(notification, origin)
+        handler = self._resolve(type(notification))
+        if handler is not None:
+            handler(notification, origin)